@@ -10,7 +10,9 @@ All outputs are subject to integrity validation and ethical compliance enforced
 """
 
 
+import itertools
 import json
+import os
 import time
 from datetime import datetime
 import logging
@@ -18,6 +20,11 @@ from flask import current_app
 
 logger = logging.getLogger(__name__)
 
+# Per-process sequence appended to memory keys (after the pid, since several
+# worker processes share the databases), so records stored within the same
+# second get distinct keys
+_KEY_COUNTER = itertools.count()
+
 class CognitiveProcessor:
     """
     Implements the 5-lobe cognitive processing model for Neuronas
@@ -210,7 +217,7 @@ class CognitiveProcessor:
         """Store processing record in tiered memory if available"""
         if hasattr(current_app, 'tiered_memory') and current_app.tiered_memory:
             try:
-                key = f"cognitive_processing_{int(time.time())}"
+                key = f"cognitive_processing_{int(time.time())}_{os.getpid()}_{next(_KEY_COUNTER)}"
                 value = json.dumps(processing_record)
                 
                 # Store in appropriate memory tier based on confidence
@@ -2,11 +2,19 @@ import random
 import logging
 import json
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timezone
 from flask import g
 
 logger = logging.getLogger(__name__)
 
+# Processus de réflexion en trois étapes, importé une seule fois au chargement
+try:
+    from core_modules.three_step_thinking import D2NeuronasThinkingProcess
+    THREE_STEP_THINKING_AVAILABLE = True
+except ImportError:
+    THREE_STEP_THINKING_AVAILABLE = False
+    logger.warning("Three-step thinking process not available, falling back to standard processing")
+
 class CognitiveEngine:
     """
     Moteur cognitif principal qui simule les fonctions du striatum, du cortex et de l'hippocampe.
@@ -141,9 +149,8 @@ class CognitiveEngine:
         Returns:
             dict: Réponse et métadonnées associées
         """
-        # Import the three-step thinking process
-        try:
-            from core_modules.three_step_thinking import D2NeuronasThinkingProcess
+        # Three-step thinking process, with a fresh reasoning state per query
+        if THREE_STEP_THINKING_AVAILABLE:
             thinking_processor = D2NeuronasThinkingProcess()
             
             # Set D2 modulation based on current state
@@ -176,9 +183,6 @@ class CognitiveEngine:
                 'd2_metrics': thinking_result['d2_metrics']
             }
             
-        except ImportError:
-            logger.warning("Three-step thinking process not available, falling back to standard processing")
-            
         # Fallback to original processing if three-step thinking unavailable
         # Vérifier les commandes spéciales
         if query.lower().startswith('modulate '):
@@ -325,6 +329,21 @@ class CoreStorageManager:
         logger.info(f"Données stockées dans tier {tier}, hémisphère {hemisphere}")
         return True
 
+    def store_many(self, records, tier=1, hemisphere='C'):
+        """
+        Stocke un lot de données en une seule opération.
+
+        Args:
+            records (list): Liste de données (dict) à stocker
+            tier (int): Niveau de stockage (1-3)
+            hemisphere (str): Hémisphère ('L', 'R', ou 'C' pour central)
+
+        Returns:
+            bool: Succès du stockage
+        """
+        logger.info(f"{len(records)} données stockées dans tier {tier}, hémisphère {hemisphere}")
+        return True
+
     def retrieve(self, key, tier=1, hemisphere='C'):
         """
         Récupère des données du stockage.
@@ -340,6 +359,25 @@ class CoreStorageManager:
         # Implémentation factice pour le moment
         return {'key': key, 'value': f"Donnée associée à {key}"}
 
+# Horodatage ISO mis en cache à la seconde : [seconde epoch, chaîne formatée]
+_ts_cache = [0, '']
+
+def utc_timestamp():
+    """
+    Renvoie l'horodatage UTC courant au format ISO, à la seconde près.
+
+    La chaîne n'est reformatée qu'une fois par seconde ; les appels suivants
+    dans la même seconde réutilisent la chaîne en cache.
+
+    Returns:
+        str: Horodatage ISO 8601 (sans microsecondes ni décalage, comme les
+            autres horodatages utcnow().isoformat() du projet)
+    """
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[:] = [now, datetime.fromtimestamp(now, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')]
+    return _ts_cache[1]
+
 class GatewayInterface:
     """
     Interface de passerelle pour le traitement des commandes et l'interaction avec le moteur cognitif.
@@ -374,7 +412,7 @@ class GatewayInterface:
             self.storage.store({
                 'query': query,
                 'response': result['response'],
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': utc_timestamp(),
                 'session_id': session_id
             })
 
@@ -654,9 +692,9 @@ class CoreEngine:
             return {"error": "Subsystems not fully initialized"}
 
         metrics = {
-            "d2_modulation": self.d2_modulation.get_activation_metrics(),
+            "d2_modulation": self.d2_modulation.get_activation_metrics().as_dict(),
             "neural_pathways": self.pathway_router.get_pathway_metrics(),
-            "d2stib_efficiency": self.d2stib.get_efficiency_metrics(),
+            "d2stib_efficiency": self.d2stib.get_efficiency_metrics().as_dict(),
             "quantum_decision": self.quantum_system.get_system_metrics(),
             "system_state": {
                 "d2_activation": self.d2_activation,
@@ -17,9 +17,41 @@ Implements D2Stim and D2Pin modulation for cognitive adaptability
 
 import numpy as np
 import random
-from collections import deque
+
+from core_modules.metrics_snapshot import MetricsSnapshot
+
 
 class D2ReceptorModulation:
+    # Query type -> row of the base modulation table (unknown types use the last row)
+    QUERY_TYPE_INDEX = {"creative": 0, "analytical": 1, "factual": 2}
+    
+    # Base (stim, pin) per query type, plus the complexity weight applied to
+    # each column: creative scales D2Pin, analytical scales D2Stim
+    BASE_MODULATION = np.array([
+        [0.3, 0.7],  # creative
+        [0.7, 0.3],  # analytical
+        [0.6, 0.4],  # factual
+        [0.5, 0.5]   # unknown - balanced
+    ])
+    COMPLEXITY_WEIGHT = np.array([
+        [0.0, 0.2],
+        [0.2, 0.0],
+        [0.0, 0.0],
+        [0.0, 0.0]
+    ])
+    
+    # Cognitive parameters, in parameter buffer order
+    COGNITIVE_PARAMS = (
+        "focus",
+        "executive_function",
+        "creativity",
+        "cognitive_flexibility",
+        "working_memory",
+        "pattern_recognition",
+        "divergent_thinking",
+        "convergent_thinking"
+    )
+    
     def __init__(self, config=None):
         """Initialize the D2 Receptor Modulation System"""
         self.config = config or {}
@@ -43,9 +75,22 @@ class D2ReceptorModulation:
         self.d2pin_level = 0.0
         self.d2_activation = 0.5  # Balanced state
         
-        # History tracking
-        self.history = deque(maxlen=10)
-        self.activation_history = deque(maxlen=100)
+        # History tracking (columnar ring buffer, see the history property)
+        self._hist_stim = np.zeros(10, dtype=np.float64)
+        self._hist_pin = np.zeros(10, dtype=np.float64)
+        self._hist_act = np.zeros(10, dtype=np.float64)
+        self._hist_idx = 0
+        self._hist_len = 0
+        
+        # Activation ring buffer with a running sum of absolute differences
+        # between consecutive samples, so stability is O(1) to query
+        self._act_buf = np.empty(100, dtype=np.float64)
+        self._act_idx = 0
+        self._act_len = 0
+        self._abs_diff_sum = 0.0
+        
+        # Reused cognitive parameter buffer (see _compute_cognitive_params)
+        self._param_buf = np.empty(len(self.COGNITIVE_PARAMS), dtype=np.float64)
         
         # Metrics
         self.metrics = {
@@ -81,13 +126,14 @@ class D2ReceptorModulation:
         self.d2_activation = 0.5 + (self.d2stim_level - self.d2pin_level) / 2
         
         # Record history
-        self.history.append({
-            "stim_level": self.d2stim_level,
-            "pin_level": self.d2pin_level,
-            "activation": self.d2_activation
-        })
+        idx = self._hist_idx
+        self._hist_stim[idx] = self.d2stim_level
+        self._hist_pin[idx] = self.d2pin_level
+        self._hist_act[idx] = self.d2_activation
+        self._hist_idx = (idx + 1) % len(self._hist_act)
+        self._hist_len = min(self._hist_len + 1, len(self._hist_act))
         
-        self.activation_history.append(self.d2_activation)
+        self._record_activation(self.d2_activation)
         
         # Update metrics
         if self.d2stim_level > self.d2pin_level + 0.2:
@@ -102,6 +148,45 @@ class D2ReceptorModulation:
         
         return self.d2_activation
     
+    @property
+    def history(self):
+        """Recent modulation states, oldest first, as a list of dicts"""
+        size = len(self._hist_act)
+        start = (self._hist_idx - self._hist_len) % size
+        order = [(start + i) % size for i in range(self._hist_len)]
+        return [
+            {
+                "stim_level": float(self._hist_stim[i]),
+                "pin_level": float(self._hist_pin[i]),
+                "activation": float(self._hist_act[i])
+            }
+            for i in order
+        ]
+    
+    def _record_activation(self, activation):
+        """Append an activation sample to the ring buffer and update the running difference sum"""
+        size = len(self._act_buf)
+        
+        if self._act_len > 0:
+            newest = float(self._act_buf[(self._act_idx - 1) % size])
+            self._abs_diff_sum += abs(activation - newest)
+        
+        if self._act_len == size:
+            # Buffer is full - the oldest sample (at the write index) drops out of the window
+            oldest = float(self._act_buf[self._act_idx])
+            second_oldest = float(self._act_buf[(self._act_idx + 1) % size])
+            self._abs_diff_sum -= abs(second_oldest - oldest)
+        else:
+            self._act_len += 1
+        
+        self._act_buf[self._act_idx] = activation
+        self._act_idx = (self._act_idx + 1) % size
+        
+        if self._act_idx == 0 and self._act_len == size:
+            # Once per wrap the buffer is in chronological order: recompute the
+            # sum from it so the add/subtract rounding error cannot accumulate
+            self._abs_diff_sum = float(np.abs(np.diff(self._act_buf)).sum())
+    
     def get_cognitive_effects(self):
         """
         Calculate cognitive effects based on current modulation levels
@@ -109,17 +194,20 @@ class D2ReceptorModulation:
         Returns:
             Dictionary of cognitive effects
         """
+        return dict(zip(self.COGNITIVE_PARAMS, self._compute_cognitive_params().tolist()))
+    
+    def _compute_cognitive_params(self):
+        """
+        Calculate cognitive effects into the preallocated parameter buffer
+        
+        Returns:
+            The parameter buffer, ordered as COGNITIVE_PARAMS (overwritten on the next call)
+        """
+        focus, executive, creativity, flexibility, working_memory, pattern, divergent, convergent = range(8)
+        
         # Base cognitive parameters
-        cognitive_params = {
-            "focus": 0.5,
-            "executive_function": 0.5,
-            "creativity": 0.5,
-            "cognitive_flexibility": 0.5,
-            "working_memory": 0.5,
-            "pattern_recognition": 0.5,
-            "divergent_thinking": 0.5,
-            "convergent_thinking": 0.5
-        }
+        params = self._param_buf
+        params.fill(0.5)
         
         # Apply D2Stim effects (focus/executive function)
         if self.d2stim_level >= self.d2stim_config["activation_threshold"]:
@@ -127,13 +215,13 @@ class D2ReceptorModulation:
             normalized_stim = stim_factor / (1 - self.d2stim_config["activation_threshold"])
             
             # Enhance focus and executive function
-            cognitive_params["focus"] += normalized_stim * self.d2stim_config["focus_enhancement"]
-            cognitive_params["executive_function"] += normalized_stim * self.d2stim_config["executive_boost"]
-            cognitive_params["convergent_thinking"] += normalized_stim * 0.4
-            cognitive_params["working_memory"] += normalized_stim * 0.3
+            params[focus] += normalized_stim * self.d2stim_config["focus_enhancement"]
+            params[executive] += normalized_stim * self.d2stim_config["executive_boost"]
+            params[convergent] += normalized_stim * 0.4
+            params[working_memory] += normalized_stim * 0.3
             
             # Reduce parameters that may be inhibited
-            cognitive_params["divergent_thinking"] -= normalized_stim * 0.2
+            params[divergent] -= normalized_stim * 0.2
             
         # Apply D2Pin effects (creativity/flexibility)
         if self.d2pin_level >= self.d2pin_config["activation_threshold"]:
@@ -141,23 +229,45 @@ class D2ReceptorModulation:
             normalized_pin = pin_factor / (1 - self.d2pin_config["activation_threshold"])
             
             # Enhance creativity and cognitive flexibility
-            cognitive_params["creativity"] += normalized_pin * self.d2pin_config["creativity_enhancement"]
-            cognitive_params["cognitive_flexibility"] += normalized_pin * self.d2pin_config["flexibility_boost"]
-            cognitive_params["divergent_thinking"] += normalized_pin * 0.5
-            cognitive_params["pattern_recognition"] += normalized_pin * 0.3
+            params[creativity] += normalized_pin * self.d2pin_config["creativity_enhancement"]
+            params[flexibility] += normalized_pin * self.d2pin_config["flexibility_boost"]
+            params[divergent] += normalized_pin * 0.5
+            params[pattern] += normalized_pin * 0.3
             
             # Reduce parameters that may be inhibited
-            cognitive_params["focus"] -= normalized_pin * 0.1
+            params[focus] -= normalized_pin * 0.1
             
         # Ensure all parameters are in valid range
-        for param in cognitive_params:
-            cognitive_params[param] = max(0.1, min(1.0, cognitive_params[param]))
+        np.clip(params, 0.1, 1.0, out=params)
             
         # Update cumulative metrics
-        self.metrics["cumulative_focus"] += cognitive_params["focus"]
-        self.metrics["cumulative_creativity"] += cognitive_params["creativity"]
+        self.metrics["cumulative_focus"] += float(params[focus])
+        self.metrics["cumulative_creativity"] += float(params[creativity])
             
-        return cognitive_params
+        return params
+    
+    def process(self, text, accelerator, stim_level=None, pin_level=None):
+        """
+        Fused modulation + D²STIB pass for hot agent loops
+        
+        Sets modulation, computes cognitive effects into the parameter buffer
+        and thresholds the text in one call, without building intermediate
+        effect or efficiency dicts.
+        
+        Args:
+            text: Input text to process
+            accelerator: D2STIBAccelerator used for token prioritization
+            stim_level: Optional D2Stim level (0-1)
+            pin_level: Optional D2Pin level (0-1)
+            
+        Returns:
+            Processed text, number of tokens, and the cognitive parameter
+            buffer (ordered as COGNITIVE_PARAMS, overwritten on the next call)
+        """
+        d2_activation = self.set_modulation(stim_level, pin_level)
+        params = self._compute_cognitive_params()
+        processed_text, tokens_total = accelerator.process_text_tokens(text, d2_activation)
+        return processed_text, tokens_total, params
     
     def apply_modulation_to_content(self, content, cognitive_params):
         """
@@ -235,29 +345,72 @@ class D2ReceptorModulation:
             "context_complexity": context_complexity
         }
     
-    def get_activation_metrics(self):
-        """Get metrics about activation patterns"""
-        # Calculate activation stability
-        stability = 0.0
-        if len(self.activation_history) > 1:
-            differences = [abs(self.activation_history[i] - self.activation_history[i-1]) 
-                          for i in range(1, len(self.activation_history))]
-            stability = 1.0 - (sum(differences) / len(differences) if differences else 0)
+    def suggest_optimal_modulation_batch(self, query_types, context_complexities, user_state=None):
+        """
+        Vectorized suggest_optimal_modulation for many queries at once
+        
+        Args:
+            query_types: Sequence of query types (creative, analytical, factual)
+            context_complexities: Sequence of complexity levels (0-1)
+            user_state: Optional user state information, shared by all queries
             
+        Returns:
+            Dictionary of arrays: suggested_stim, suggested_pin, resulting_activation
+        """
+        unknown = len(self.BASE_MODULATION) - 1
+        idx = np.fromiter((self.QUERY_TYPE_INDEX.get(q, unknown) for q in query_types),
+                          dtype=np.intp, count=len(query_types))
+        complexity = np.asarray(context_complexities, dtype=np.float64)
+        
+        # Base levels per query type, adjusted by complexity
+        levels = self.BASE_MODULATION[idx] + self.COMPLEXITY_WEIGHT[idx] * complexity[:, None]
+        stim = levels[:, 0]
+        pin = levels[:, 1]
+        
+        # Very complex contexts benefit from more executive function
+        np.minimum(stim + 0.1, 1.0, out=stim, where=complexity > 0.7)
+        
+        # Incorporate user state if available (70% suggestion, 30% user preference)
+        if user_state and "preferred_modulation" in user_state:
+            stim = stim * 0.7 + user_state["preferred_modulation"].get("stim", 0.5) * 0.3
+            pin = pin * 0.7 + user_state["preferred_modulation"].get("pin", 0.5) * 0.3
+        
+        # Ensure valid ranges
+        stim = np.clip(stim, 0.0, 1.0)
+        pin = np.clip(pin, 0.0, 1.0)
+        
         return {
-            "stim_activations": self.metrics["stim_activations"],
-            "pin_activations": self.metrics["pin_activations"],
-            "balanced_states": self.metrics["balanced_states"],
-            "max_stim_level": self.metrics["max_stim_level"],
-            "max_pin_level": self.metrics["max_pin_level"],
-            "current_stim": self.d2stim_level,
-            "current_pin": self.d2pin_level,
-            "current_activation": self.d2_activation,
-            "activation_stability": stability,
-            "focus_creativity_ratio": (self.metrics["cumulative_focus"] / self.metrics["cumulative_creativity"] 
-                                     if self.metrics["cumulative_creativity"] > 0 else 1.0)
+            "suggested_stim": stim,
+            "suggested_pin": pin,
+            "resulting_activation": 0.5 + (stim - pin) / 2
         }
     
+    def get_activation_metrics(self):
+        """
+        Get metrics about activation patterns
+        
+        Returns:
+            MetricsSnapshot, new on each call (as_dict() for a plain dict)
+        """
+        # Calculate activation stability
+        stability = 0.0
+        if self._act_len > 1:
+            stability = 1.0 - self._abs_diff_sum / (self._act_len - 1)
+        
+        return MetricsSnapshot(
+            stim_activations=self.metrics["stim_activations"],
+            pin_activations=self.metrics["pin_activations"],
+            balanced_states=self.metrics["balanced_states"],
+            max_stim_level=self.metrics["max_stim_level"],
+            max_pin_level=self.metrics["max_pin_level"],
+            current_stim=self.d2stim_level,
+            current_pin=self.d2pin_level,
+            current_activation=self.d2_activation,
+            activation_stability=stability,
+            focus_creativity_ratio=(self.metrics["cumulative_focus"] / self.metrics["cumulative_creativity"]
+                                    if self.metrics["cumulative_creativity"] > 0 else 1.0)
+        )
+    
     def reset_modulation(self):
         """Reset modulation to balanced state"""
         self.d2stim_level = 0.0
@@ -16,9 +16,80 @@ Implements second-derivative linguistic prioritization for token processing effi
 """
 
 import numpy as np
-from collections import OrderedDict, defaultdict
+import hashlib
+from collections import OrderedDict, defaultdict, deque
 import math
 import re
+import threading
+
+from core_modules.metrics_snapshot import MetricsSnapshot
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _second_deriv_adjust_kernel(importance_map):
+    """
+    Second derivative of an importance map and the importance adjusted by it
+    
+    Plain loops so Numba can compile it; see _second_deriv_adjust.
+    """
+    n = importance_map.shape[0]
+    second_derivative = np.zeros(n)
+    adjusted = importance_map.copy()
+    
+    prev_first = 0.0
+    for i in range(1, n):
+        first = importance_map[i] - importance_map[i-1]
+        accel = first - prev_first
+        prev_first = first
+        second_derivative[i] = accel
+        
+        # High acceleration gets priority: boost on positive, reduce on negative
+        if accel > 0.2:
+            adjusted[i] = min(importance_map[i] + accel * 0.5, 1.0)
+        elif accel < -0.2:
+            adjusted[i] = max(importance_map[i] + accel * 0.3, 0.1)
+    
+    return second_derivative, adjusted
+
+
+def _second_deriv_adjust_numpy(importance_map):
+    """Vectorized equivalent of _second_deriv_adjust_kernel for when Numba is unavailable"""
+    n = importance_map.shape[0]
+    first_derivative = np.zeros(n)
+    first_derivative[1:] = np.diff(importance_map)
+    second_derivative = np.zeros(n)
+    second_derivative[1:] = np.diff(first_derivative)
+    
+    adjusted = importance_map.copy()
+    boost = second_derivative > 0.2
+    reduce = second_derivative < -0.2
+    adjusted[boost] = np.minimum(importance_map[boost] + second_derivative[boost] * 0.5, 1.0)
+    adjusted[reduce] = np.maximum(importance_map[reduce] + second_derivative[reduce] * 0.3, 0.1)
+    
+    return second_derivative, adjusted
+
+
+if NUMBA_AVAILABLE:
+    # cache=True persists the compiled kernel next to this module, so only the
+    # very first import pays the cold compile (hundreds of ms); later processes
+    # load it from disk.
+    _second_deriv_adjust = njit(cache=True, boundscheck=False)(_second_deriv_adjust_kernel)
+else:
+    _second_deriv_adjust = _second_deriv_adjust_numpy
+
+
+def _d2stib_warmup():
+    """Compile (or load from cache) the derivative kernel so the first query doesn't pay for it"""
+    _second_deriv_adjust(np.zeros(64, dtype=np.float64))
+
+
+_d2stib_warmup()
+
 
 class D2STIBAccelerator:
     def __init__(self, config=None):
@@ -38,12 +109,25 @@ class D2STIBAccelerator:
             "processing_time": 0,
         }
         
-        # Semantic importance cache
-        self.semantic_cache = {}
+        # Semantic importance cache (LRU, bounded for long-running processes)
+        self.semantic_cache = OrderedDict()
+        self.semantic_cache_size = self.config.get("semantic_cache_size", 10000)
+        
+        # Per-text importance cache (LRU) - repeated queries skip tokenization
+        # and importance analysis; only the D2 threshold step runs per call
+        self.importance_cache = OrderedDict()
+        self.importance_cache_size = self.config.get("importance_cache_size", 256)
+        
+        # Request threads share the accelerator: LRU lookups, reordering and
+        # evictions happen under this lock
+        self._cache_lock = threading.Lock()
         
-        # Second derivative tracking
-        self.token_history = []
-        self.derivative_history = []
+        # Punctuation split off the end of words by the tokenizer
+        self._punctuation = frozenset(".,:;!?\"'()[]{}")
+        
+        # Second derivative tracking (bounded, oldest entries drop off)
+        self.token_history = deque(maxlen=5)
+        self.derivative_history = deque(maxlen=5)
         
     def process_text(self, text, d2_activation=0.5):
         """
@@ -56,6 +140,64 @@ class D2STIBAccelerator:
         Returns:
             Processed text and processing metrics
         """
+        processed_text, tokens_total = self.process_text_tokens(text, d2_activation)
+        
+        # Calculate efficiency metrics
+        efficiency = {
+            "tokens_total": tokens_total,
+            "tokens_processed_fully": self.stats["tokens_processed"],
+            "tokens_skipped": self.stats["tokens_skipped"],
+            "efficiency_gain": self.efficiency_gain,
+            "processing_reduction": self.stats["tokens_skipped"] / tokens_total if tokens_total > 0 else 0
+        }
+        
+        return processed_text, efficiency
+    
+    def process_text_tokens(self, text, d2_activation=0.5):
+        """
+        Process text like process_text, without building an efficiency dict
+        
+        Updates the same token stats; meant for hot loops that only need the
+        processed text and its token count.
+        
+        Args:
+            text: Input text to process
+            d2_activation: Current D2 activation level (0-1)
+            
+        Returns:
+            Processed text and number of tokens
+        """
+        tokens, importance_map, processed_text = self._analyze_text(text)
+        
+        # Determine processing threshold based on D2 activation
+        # Higher D2 activation = more selective processing
+        threshold = 0.3 + (d2_activation * 0.4)
+        
+        # Low-importance tokens skip detailed processing; prioritized tokens
+        # (> 0.8) always clear the threshold, which never exceeds 0.7
+        tokens_processed = int(np.count_nonzero(importance_map >= threshold))
+        self.stats["tokens_processed"] += tokens_processed
+        self.stats["tokens_skipped"] += len(tokens) - tokens_processed
+        self.stats["tokens_prioritized"] += int(np.count_nonzero(importance_map > 0.8))
+        
+        # Update stats
+        self.stats["semantic_maps"] += 1
+        
+        return processed_text, len(tokens)
+    
+    def _analyze_text(self, text):
+        """
+        Return tokens, importance map and reconstructed text, using the LRU importance cache
+        
+        Every token is kept regardless of importance, so the reconstructed
+        text depends only on the input and is cached alongside the map.
+        """
+        with self._cache_lock:
+            cached = self.importance_cache.get(text)
+            if cached is not None:
+                self.importance_cache.move_to_end(text)
+                return cached
+        
         # Tokenize text (simplified)
         tokens = self._tokenize(text)
         
@@ -66,52 +208,27 @@ class D2STIBAccelerator:
         if self.second_derivative:
             importance_map = self._apply_second_derivative(importance_map)
         
-        # Determine processing threshold based on D2 activation
-        # Higher D2 activation = more selective processing
-        threshold = 0.3 + (d2_activation * 0.4)
-        
-        # Process tokens based on importance
-        processed_tokens = []
-        for i, token in enumerate(tokens):
-            importance = importance_map[i]
-            
-            if importance >= threshold:
-                # Process token fully
-                processed_tokens.append(token)
-                self.stats["tokens_processed"] += 1
-                
-                if importance > 0.8:
-                    self.stats["tokens_prioritized"] += 1
-            else:
-                # Skip detailed processing for low-importance tokens
-                processed_tokens.append(token)
-                self.stats["tokens_skipped"] += 1
+        # Cached maps are shared between calls, so keep them read-only
+        importance_map.flags.writeable = False
         
         # Reconstruct text
-        processed_text = self._reconstruct_text(processed_tokens)
-        
-        # Update stats
-        self.stats["semantic_maps"] += 1
+        analysis = (tokens, importance_map, self._reconstruct_text(tokens))
         
-        # Calculate efficiency metrics
-        efficiency = {
-            "tokens_total": len(tokens),
-            "tokens_processed_fully": self.stats["tokens_processed"],
-            "tokens_skipped": self.stats["tokens_skipped"],
-            "efficiency_gain": self.efficiency_gain,
-            "processing_reduction": self.stats["tokens_skipped"] / len(tokens) if len(tokens) > 0 else 0
-        }
+        with self._cache_lock:
+            self.importance_cache[text] = analysis
+            self.importance_cache.move_to_end(text)
+            if len(self.importance_cache) > self.importance_cache_size:
+                self.importance_cache.popitem(last=False)
         
-        return processed_text, efficiency
+        return analysis
     
     def _tokenize(self, text):
         """Simple tokenization (in a real system, would use a proper tokenizer)"""
-        # This is a very simplified tokenization approach
+        punctuation = self._punctuation
         tokens = []
-        # Split by spaces but keep punctuation
+        # Split by spaces but keep trailing punctuation as its own token
         for word in text.split():
-            # Check if word ends with punctuation
-            if word and word[-1] in ".,:;!?\"'()[]{}":
+            if len(word) > 1 and word[-1] in punctuation:
                 tokens.append(word[:-1])
                 tokens.append(word[-1])
             else:
@@ -132,106 +249,106 @@ class D2STIBAccelerator:
             "low": r'^(the|a|an|and|or|but|if|then|than|to|of|for|in|on|at|by)$'
         }
         
-        # Assign base importance
-        for i, token in enumerate(tokens):
-            token_lower = token.lower()
-            
-            # Check if token is in cache
-            if token_lower in self.semantic_cache:
-                importance_map[i] = self.semantic_cache[token_lower]
-                continue
+        # Assign base importance; the shared LRU cache is only touched under
+        # the lock, so concurrent lookups and evictions cannot interleave
+        with self._cache_lock:
+            for i, token in enumerate(tokens):
+                token_lower = token.lower()
                 
-            # Assign importance based on patterns
-            if re.match(importance_patterns["high"], token_lower):
-                importance = random.uniform(0.8, 1.0)
-            elif re.match(importance_patterns["medium"], token_lower):
-                importance = random.uniform(0.5, 0.8)
-            elif re.match(importance_patterns["low"], token_lower):
-                importance = random.uniform(0.1, 0.5)
-            else:
-                # Default importance based on token length and other factors
-                importance = 0.3 + min(len(token_lower) / 20, 0.4)
-            
-            # Cache the importance value
-            self.semantic_cache[token_lower] = importance
-            importance_map[i] = importance
+                # Check if token is in cache
+                if token_lower in self.semantic_cache:
+                    self.semantic_cache.move_to_end(token_lower)
+                    importance_map[i] = self.semantic_cache[token_lower]
+                    continue
+                
+                # Assign importance based on patterns
+                if re.match(importance_patterns["high"], token_lower):
+                    importance = 0.8 + self._token_jitter(token_lower) * 0.2
+                elif re.match(importance_patterns["medium"], token_lower):
+                    importance = 0.5 + self._token_jitter(token_lower) * 0.3
+                elif re.match(importance_patterns["low"], token_lower):
+                    importance = 0.1 + self._token_jitter(token_lower) * 0.4
+                else:
+                    # Default importance based on token length and other factors
+                    importance = 0.3 + min(len(token_lower) / 20, 0.4)
+                
+                # Cache the importance value, evicting the least recently used
+                self.semantic_cache[token_lower] = importance
+                if len(self.semantic_cache) > self.semantic_cache_size:
+                    self.semantic_cache.popitem(last=False)
+                importance_map[i] = importance
             
         # Apply contextual adjustments
-        for i in range(1, len(tokens) - 1):
+        if len(tokens) > 2:
             # Boost importance if surrounded by high-importance tokens
-            if importance_map[i-1] > 0.7 and importance_map[i+1] > 0.7:
-                importance_map[i] = min(importance_map[i] + 0.2, 1.0)
+            left = importance_map[:-2] > 0.7
+            right = importance_map[2:] > 0.7
+            boost = left & right
+            
+            # Boosts apply left to right, so a boosted token can in turn lift
+            # its right neighbour's left context above the threshold
+            lifted = boost[:-1] & (np.minimum(importance_map[1:-2] + 0.2, 1.0) > 0.7)
+            boost[1:] |= lifted & right[1:]
+            
+            inner = importance_map[1:-1]
+            inner[boost] = np.minimum(inner[boost] + 0.2, 1.0)
         
         return importance_map
     
+    def _token_jitter(self, token):
+        """
+        Deterministic value in [0, 1] derived from the token
+        
+        Uses a stable digest rather than hash(), which is salted per process,
+        so the same token scores identically across sessions.
+        """
+        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=2).digest()
+        return int.from_bytes(digest, "little") / 65535.0
+    
     def _apply_second_derivative(self, importance_map):
         """Apply second derivative analysis to importance map"""
-        # Calculate first derivative (rate of change)
-        first_derivative = np.zeros(len(importance_map))
-        for i in range(1, len(importance_map)):
-            first_derivative[i] = importance_map[i] - importance_map[i-1]
-        
-        # Calculate second derivative (acceleration)
-        second_derivative = np.zeros(len(importance_map))
-        for i in range(1, len(first_derivative)):
-            second_derivative[i] = first_derivative[i] - first_derivative[i-1]
+        # Second derivative (acceleration) and the importance adjusted by it
+        second_derivative, adjusted_importance = _second_deriv_adjust(importance_map)
         
         # Track in history
         self.token_history.append(importance_map)
         self.derivative_history.append(second_derivative)
         
-        # Keep history manageable
-        if len(self.token_history) > 5:
-            self.token_history.pop(0)
-            self.derivative_history.pop(0)
-        
-        # Apply second derivative boosting - high acceleration gets priority
-        adjusted_importance = importance_map.copy()
-        for i in range(len(importance_map)):
-            if abs(second_derivative[i]) > 0.2:  # Significant acceleration
-                # Boost or reduce importance based on direction of acceleration
-                if second_derivative[i] > 0:  # Positive acceleration
-                    adjusted_importance[i] = min(importance_map[i] + abs(second_derivative[i]) * 0.5, 1.0)
-                else:  # Negative acceleration
-                    adjusted_importance[i] = max(importance_map[i] - abs(second_derivative[i]) * 0.3, 0.1)
-        
         return adjusted_importance
     
     def _reconstruct_text(self, tokens):
         """Reconstruct text from tokens"""
         # This is a simplified reconstruction
-        text = ""
-        for i, token in enumerate(tokens):
-            # Add space before token unless it's punctuation or first token
-            if i > 0 and token not in ".,:;!?\"'()[]{}":
-                text += " "
-            text += token
-        return text
+        # Add space before token unless it's punctuation or first token
+        return "".join(
+            token if i == 0 or token in ".,:;!?\"'()[]{}" else " " + token
+            for i, token in enumerate(tokens)
+        )
     
     def get_efficiency_metrics(self):
-        """Get current efficiency metrics"""
-        total_tokens = self.stats["tokens_processed"] + self.stats["tokens_skipped"]
+        """
+        Get current efficiency metrics
         
-        if total_tokens == 0:
-            return {
-                "processing_reduction": 0,
-                "efficiency_gain": self.efficiency_gain,
-                "tokens_total": 0,
-                "semantic_precision": 0
-            }
+        Returns:
+            MetricsSnapshot, new on each call (as_dict() for a plain dict)
+        """
+        total_tokens = self.stats["tokens_processed"] + self.stats["tokens_skipped"]
         
-        processing_reduction = self.stats["tokens_skipped"] / total_tokens
-        prioritization_ratio = self.stats["tokens_prioritized"] / total_tokens if total_tokens > 0 else 0
+        snap = MetricsSnapshot(
+            processing_reduction=0,
+            efficiency_gain=self.efficiency_gain,
+            tokens_total=total_tokens,
+            tokens_processed=self.stats["tokens_processed"],
+            tokens_skipped=self.stats["tokens_skipped"],
+            prioritization_ratio=0,
+            semantic_precision=0
+        )
         
-        return {
-            "processing_reduction": processing_reduction,
-            "efficiency_gain": self.efficiency_gain,
-            "tokens_total": total_tokens,
-            "tokens_processed": self.stats["tokens_processed"],
-            "tokens_skipped": self.stats["tokens_skipped"],
-            "prioritization_ratio": prioritization_ratio,
-            "semantic_precision": 0.993  # This would be calculated in a real system
-        }
+        if total_tokens > 0:
+            snap.processing_reduction = self.stats["tokens_skipped"] / total_tokens
+            snap.prioritization_ratio = self.stats["tokens_prioritized"] / total_tokens
+            snap.semantic_precision = 0.993  # This would be calculated in a real system
+        return snap
     
     def reset_stats(self):
         """Reset processing statistics"""
@@ -242,6 +359,3 @@ class D2STIBAccelerator:
             "semantic_maps": 0,
             "processing_time": 0,
         }
-
-# Required for simple tokenization example
-import random
@@ -9,13 +9,95 @@ Core modules referenced: BRONAS (Ethical Reflex Filter) and QRONAS (Probabilisti
 All outputs are subject to integrity validation and ethical compliance enforced by BRONAS.
 """
 
+import functools
 import logging
 import random
 import re
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Potentially harmful content keywords
+HARMFUL_KEYWORDS = (
+    'harm', 'hurt', 'dangerous', 'illegal', 'violent',
+    'discriminate', 'hate', 'exploit'
+)
+
+# Overly certain language keywords (lack of transparency)
+CERTAIN_KEYWORDS = (
+    'definitely', 'absolutely', 'always', 'never',
+    'certainly', 'undoubtedly', 'unquestionably'
+)
+
+# Keyword alternations compiled once. Detection runs on lowercased content:
+# CPython's re scans an IGNORECASE alternation several times slower than a
+# case-sensitive one, which outweighs the cost of a single content.lower().
+_HARMFUL_RE = re.compile('|'.join(HARMFUL_KEYWORDS))
+_CERTAIN_RE = re.compile('|'.join(CERTAIN_KEYWORDS))
+_RISK_KEYWORD_RE = re.compile('|'.join(HARMFUL_KEYWORDS + CERTAIN_KEYWORDS))
+
+# Strict-mode removal must keep the original casing of surrounding text
+_HARMFUL_WORD_RE = re.compile(r'\b(?:%s)\w*\b' % '|'.join(HARMFUL_KEYWORDS), re.IGNORECASE)
+
+# Multi-perspective notes appended by bias mitigation
+MITIGATION_PHRASES = (
+    " Consider that there are multiple perspectives on this topic.",
+    " Alternative viewpoints may offer different insights.",
+    " This perspective is one of several valid approaches.",
+    " Different contexts may yield different interpretations."
+)
+
+# Suffixes appended to content, prebuilt with and without the sentence-closing
+# period so each append is a single concatenation: (ends with '.', needs '.')
+_MITIGATION_SUFFIXES = tuple(
+    (sys.intern(phrase), sys.intern('.' + phrase)) for phrase in MITIGATION_PHRASES
+)
+_TRANSPARENCY_NOTE = " Note that this represents one perspective and there may be alternative viewpoints."
+_TRANSPARENCY_SUFFIXES = (sys.intern(_TRANSPARENCY_NOTE), sys.intern('.' + _TRANSPARENCY_NOTE))
+
+# Word tokenizer for ReflexGate statement terms
+_WORD_RE = re.compile(r'\w+')
+
+# Result of a risk assessment; the hit flags let the guidelines skip rescans
+RiskReport = namedtuple('RiskReport', ['score', 'harmful_hit', 'certain_hit'])
+
+
+@functools.lru_cache(maxsize=4096)
+def _risk_score(lowered):
+    """
+    Compute the ethical risk score of content (see BronasEthicalFramework._assess_ethical_risk).
+    
+    Takes already-lowercased content. Pure function of its input, memoized
+    with a bounded LRU cache.
+    
+    Returns:
+        RiskReport: Risk score (0.0-1.0) and whether each keyword category matched
+    """
+    # Simplified risk assessment:
+    # - Check for ethical principle violations
+    # - Check for potential harmful content
+    # - Check for unbalanced perspectives
+    
+    risk_score = 0.0
+    
+    # Check for potentially harmful content - every occurrence counts,
+    # up to 5 per category so one repeated word cannot dominate
+    harmful_hits = len(_HARMFUL_RE.findall(lowered))
+    risk_score += 0.2 * min(harmful_hits, 5)
+    
+    # Check for overly certain language (lack of transparency)
+    certain_hits = len(_CERTAIN_RE.findall(lowered))
+    risk_score += 0.1 * min(certain_hits, 5)
+    
+    # Cap risk score at 1.0
+    return RiskReport(min(1.0, risk_score), harmful_hits > 0, certain_hits > 0)
+
+
 class BronasEthicalFramework:
     """
     Implements BRONAS (Bayesian Reinforcement Optimized Neural Adaptive System)
@@ -30,13 +112,21 @@ class BronasEthicalFramework:
             "transparency": "Be clear about limitations and uncertainty"
         }
         
-        # Initialize belief model for ethical reasoning
-        self.belief_model = {
-            "multi_perspective": 0.9,  # Strong belief in offering multiple perspectives
-            "bias_mitigation": 0.8,    # Strong belief in mitigating biases
-            "uncertainty_disclosure": 0.7,  # Medium-high belief in disclosing uncertainty
-            "harm_prevention": 0.95    # Very strong belief in preventing harm
-        }
+        # Initialize belief model for ethical reasoning, stored as a belief
+        # array plus a concept -> index map (see the belief_model property)
+        self._belief_index = {}
+        self._beliefs = np.zeros(16, dtype=np.float64)
+        self._add_belief("multi_perspective", 0.9)       # Strong belief in offering multiple perspectives
+        self._add_belief("bias_mitigation", 0.8)         # Strong belief in mitigating biases
+        self._add_belief("uncertainty_disclosure", 0.7)  # Medium-high belief in disclosing uncertainty
+        self._add_belief("harm_prevention", 0.95)        # Very strong belief in preventing harm
+        
+        # Pre-drawn random batch for bias mitigation (decision draw, phrase index),
+        # shared by request threads: reads and refills happen under _rand_lock
+        self._rng = np.random.default_rng()
+        self._rand_buf_size = 1024
+        self._rand_lock = threading.Lock()
+        self._refill_random_buffer()
         
         # Ethical risk thresholds
         self.risk_thresholds = {
@@ -61,17 +151,26 @@ class BronasEthicalFramework:
         if not content:
             return ""
         
+        # Lowercase once; keyword scans below share this copy
+        lowered = content.lower()
+        
+        # Fast path: without any risk keyword the risk is zero, so skip the
+        # assessment and guidelines and go straight to bias mitigation
+        if not _RISK_KEYWORD_RE.search(lowered):
+            return self._mitigate_bias(content, context_type)
+        
         # Risk assessment
-        risk_level = self._assess_ethical_risk(content)
+        report = self._assess_ethical_risk(content, lowered)
+        risk_level = report.score
         
         # Apply appropriate ethical filtering based on risk
         if risk_level >= self.risk_thresholds["high"]:
             # High risk - apply strict ethical filtering
-            filtered_content = self._apply_ethical_guidelines(content, strict=True)
+            filtered_content = self._apply_ethical_guidelines(content, strict=True, report=report)
             logger.debug("Applied strict ethical filtering due to high risk")
         elif risk_level >= self.risk_thresholds["medium"]:
             # Medium risk - apply standard filtering
-            filtered_content = self._apply_ethical_guidelines(content, strict=False)
+            filtered_content = self._apply_ethical_guidelines(content, strict=False, report=report)
             logger.debug("Applied standard ethical filtering for medium risk")
         else:
             # Low risk - minimal filtering
@@ -83,83 +182,51 @@ class BronasEthicalFramework:
         
         return mitigated_content
     
-    def _assess_ethical_risk(self, content):
+    def _assess_ethical_risk(self, content, lowered=None):
         """
         Assess the ethical risk level of content.
         
         Args:
             content (str): Content to assess
+            lowered (str): Optional content.lower(), if the caller already has it
             
         Returns:
-            float: Risk level (0.0-1.0)
+            RiskReport: Risk level (0.0-1.0) and keyword hit flags
         """
-        # Simplified risk assessment:
-        # - Check for ethical principle violations
-        # - Check for potential harmful content
-        # - Check for unbalanced perspectives
-        
-        risk_score = 0.0
-        
-        # Check for potentially harmful content
-        harmful_patterns = [
-            r'harm', r'hurt', r'dangerous', r'illegal', r'violent', 
-            r'discriminate', r'hate', r'exploit'
-        ]
-        
-        for pattern in harmful_patterns:
-            if re.search(pattern, content.lower()):
-                risk_score += 0.2
-        
-        # Check for overly certain language (lack of transparency)
-        certain_patterns = [
-            r'definitely', r'absolutely', r'always', r'never', 
-            r'certainly', r'undoubtedly', r'unquestionably'
-        ]
-        
-        for pattern in certain_patterns:
-            if re.search(pattern, content.lower()):
-                risk_score += 0.1
-        
-        # Cap risk score at 1.0
-        return min(1.0, risk_score)
+        # Identical content (session replays, retries) hits the shared cache
+        return _risk_score(content.lower() if lowered is None else lowered)
     
-    def _apply_ethical_guidelines(self, content, strict=False):
+    def _apply_ethical_guidelines(self, content, strict=False, report=None):
         """
         Apply ethical guidelines to content.
         
         Args:
             content (str): Content to filter
             strict (bool): Whether to apply strict filtering
+            report (RiskReport): Optional risk assessment of content, reused
+                instead of rescanning for keywords
             
         Returns:
             str: Filtered content
         """
+        if report is None:
+            report = self._assess_ethical_risk(content)
+        certain_hit = report.certain_hit
+        
         # Apply beneficence principle - ensure content promotes well-being
-        if strict:
+        if strict and report.harmful_hit:
             # For strict filtering, remove potentially harmful content completely
-            harmful_patterns = [
-                r'harm', r'hurt', r'dangerous', r'illegal', r'violent', 
-                r'discriminate', r'hate', r'exploit'
-            ]
-            
-            for pattern in harmful_patterns:
-                content = re.sub(f"\\b{pattern}\\w*\\b", "[removed]", content, flags=re.IGNORECASE)
+            content, removed = _HARMFUL_WORD_RE.subn("[removed]", content)
+            if removed:
+                # A removed word may have contained certain language
+                certain_hit = _CERTAIN_RE.search(content.lower()) is not None
         
         # Apply transparency principle - add uncertainty disclosures
-        if self.belief_model["uncertainty_disclosure"] > 0.5:
+        if self.get_belief("uncertainty_disclosure") > 0.5:
             # Check if content contains very certain language
-            certain_patterns = [
-                r'definitely', r'absolutely', r'always', r'never', 
-                r'certainly', r'undoubtedly', r'unquestionably'
-            ]
-            
-            for pattern in certain_patterns:
-                if re.search(pattern, content.lower()):
-                    # Add transparency note to highly certain content
-                    if not content.endswith('.'):
-                        content += '.'
-                    content += " Note that this represents one perspective and there may be alternative viewpoints."
-                    break
+            if certain_hit:
+                # Add transparency note to highly certain content
+                content += _TRANSPARENCY_SUFFIXES[not content.endswith('.')]
         
         return content
     
@@ -175,30 +242,59 @@ class BronasEthicalFramework:
             str: Bias-mitigated content
         """
         # Base bias mitigation threshold on belief model
-        mitigation_threshold = self.belief_model["bias_mitigation"]
+        mitigation_threshold = self.get_belief("bias_mitigation")
         
         # Adjust threshold based on context type
         if context_type == "factual":
             mitigation_threshold += 0.1  # Higher mitigation for factual content
         
+        # Take the next pre-drawn decision and phrase index
+        with self._rand_lock:
+            if self._rand_pos == self._rand_buf_size:
+                self._refill_random_buffer()
+            draw = self._rand_draws[self._rand_pos]
+            phrase_index = self._rand_phrases[self._rand_pos]
+            self._rand_pos += 1
+        
         # Apply bias mitigation randomly based on threshold
-        if random.random() < mitigation_threshold:
-            # Add multi-perspective note to encourage considering alternatives
-            if not content.endswith('.'):
-                content += '.'
-            
-            # Select a random mitigation phrase based on context
-            mitigation_phrases = [
-                " Consider that there are multiple perspectives on this topic.",
-                " Alternative viewpoints may offer different insights.",
-                " This perspective is one of several valid approaches.",
-                " Different contexts may yield different interpretations."
-            ]
-            
-            content += random.choice(mitigation_phrases)
+        if draw < mitigation_threshold:
+            # Add a random multi-perspective note to encourage considering alternatives
+            content += _MITIGATION_SUFFIXES[phrase_index][not content.endswith('.')]
         
         return content
     
+    def _refill_random_buffer(self):
+        """Draw a fresh batch of bias-mitigation decisions and phrase indices"""
+        self._rand_draws = self._rng.random(self._rand_buf_size).tolist()
+        self._rand_phrases = self._rng.integers(0, len(MITIGATION_PHRASES), self._rand_buf_size).tolist()
+        self._rand_pos = 0
+    
+    @property
+    def belief_model(self):
+        """Snapshot of the belief model as a {concept: belief} dict"""
+        return {concept: float(self._beliefs[i]) for concept, i in self._belief_index.items()}
+    
+    def _add_belief(self, concept, value):
+        """
+        Register a new belief concept, growing storage in chunks of 16.
+        
+        Args:
+            concept (str): Belief concept
+            value (float): Initial belief value
+            
+        Returns:
+            int: Index of the concept in the belief array
+        """
+        i = len(self._belief_index)
+        if i == len(self._beliefs):
+            grown = np.zeros(len(self._beliefs) + 16, dtype=self._beliefs.dtype)
+            grown[:i] = self._beliefs
+            self._beliefs = grown
+        
+        self._belief_index[concept] = i
+        self._beliefs[i] = value
+        return i
+    
     def update_belief(self, concept, feedback_value):
         """
         Update belief model based on feedback.
@@ -210,20 +306,21 @@ class BronasEthicalFramework:
         Returns:
             float: Updated belief value
         """
-        if concept not in self.belief_model:
-            self.belief_model[concept] = 0.5  # Initialize with neutral belief
+        i = self._belief_index.get(concept)
+        if i is None:
+            i = self._add_belief(concept, 0.5)  # Initialize with neutral belief
         
         # Convert feedback to 0.0-1.0 range
         normalized_feedback = (feedback_value + 1.0) / 2.0
         
         # Apply Bayesian-inspired update
-        prior = self.belief_model[concept]
+        prior = float(self._beliefs[i])
         posterior = (prior + normalized_feedback) / 2.0
         
         # Update belief
-        self.belief_model[concept] = posterior
+        self._beliefs[i] = posterior
         
-        logger.debug(f"Updated belief '{concept}' from {prior} to {posterior}")
+        logger.debug("Updated belief '%s' from %s to %s", concept, prior, posterior)
         return posterior
     
     def get_belief(self, concept):
@@ -236,17 +333,57 @@ class BronasEthicalFramework:
         Returns:
             float: Belief value or 0.5 if not found
         """
-        return self.belief_model.get(concept, 0.5)
+        i = self._belief_index.get(concept)
+        return float(self._beliefs[i]) if i is not None else 0.5
 
 class ReflexGate:
     """
     Implements ReflexGate for self-consistency checking and contradiction detection.
     """
-    def __init__(self):
-        self.belief_log = {}
+    def __init__(self, belief_log_size=4096):
+        # statement -> (confidence, terms, has_trigger), see _statement_terms.
+        # Bounded: once full, the least recently logged statement is evicted
+        # and no longer takes part in contradiction checks.
+        self.belief_log = OrderedDict()
+        self.belief_log_size = belief_log_size
         self.contradiction_threshold = 0.3
+        
+        # (pattern, opposite) pairs for exact opposite statements, matched
+        # against the term sets from _statement_terms
+        self.opposite_patterns = (
+            ('is', 'is not'),
+            ('can', 'cannot'),
+            ('should', 'should not'),
+            ('will', 'will not'),
+            ('does', 'does not'),
+            ('has', 'has not')
+        )
+        
+        # Every term of a pattern pair; a statement without any of them
+        # cannot take part in a contradiction
+        self._triggers = frozenset(
+            word for pair in self.opposite_patterns for term in pair for word in term.split()
+        )
         logger.info("ReflexGate initialized")
     
+    def _statement_terms(self, statement):
+        """
+        Tokenize a statement once into a set of lowercase words and word pairs.
+        
+        Word pairs ("is not") are included so multi-word patterns are plain
+        set lookups instead of regex searches.
+        
+        Args:
+            statement (str): Statement to tokenize
+            
+        Returns:
+            frozenset: Words and space-joined adjacent word pairs
+        """
+        words = _WORD_RE.findall(statement.lower())
+        terms = set(words)
+        terms.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+        return frozenset(terms)
+    
     def log_belief(self, statement, confidence):
         """
         Log a belief statement with confidence.
@@ -255,7 +392,21 @@ class ReflexGate:
             statement (str): Belief statement
             confidence (float): Confidence in the statement (0.0-1.0)
         """
-        self.belief_log[statement] = confidence
+        terms = self._statement_terms(statement)
+        self._log_entry(statement, (confidence, terms, not terms.isdisjoint(self._triggers)))
+    
+    def _log_entry(self, statement, entry):
+        """
+        Store a belief_log entry, evicting the least recently logged one when full.
+        
+        Args:
+            statement (str): Belief statement
+            entry (tuple): (confidence, terms, has_trigger)
+        """
+        self.belief_log[statement] = entry
+        self.belief_log.move_to_end(statement)
+        if len(self.belief_log) > self.belief_log_size:
+            self.belief_log.popitem(last=False)
     
     def check_contradiction(self, statement, confidence):
         """
@@ -268,27 +419,21 @@ class ReflexGate:
         Returns:
             dict: Contradiction check results
         """
-        # Check for exact opposite statements
-        opposite_patterns = {
-            r'is': r'is not',
-            r'can': r'cannot',
-            r'should': r'should not',
-            r'will': r'will not',
-            r'does': r'does not',
-            r'has': r'has not'
-        }
-        
+        terms = self._statement_terms(statement)
+        has_trigger = not terms.isdisjoint(self._triggers)
         contradictions = []
         
-        for logged_statement, logged_confidence in self.belief_log.items():
-            # Skip low confidence statements
-            if logged_confidence < 0.3:
+        # Without a trigger word there is nothing to match, skip the scan
+        logged_items = self.belief_log.items() if has_trigger else ()
+        
+        for logged_statement, (logged_confidence, logged_terms, logged_trigger) in logged_items:
+            # Skip low confidence statements and ones without trigger words
+            if logged_confidence < 0.3 or not logged_trigger:
                 continue
             
             # Check for direct contradictions using patterns
-            for pattern, opposite in opposite_patterns.items():
-                if (re.search(f"\\b{pattern}\\b", statement) and 
-                    re.search(f"\\b{opposite}\\b", logged_statement)):
+            for pattern, opposite in self.opposite_patterns:
+                if pattern in terms and opposite in logged_terms:
                     # Potential contradiction
                     contradiction_score = logged_confidence * confidence
                     if contradiction_score > self.contradiction_threshold:
@@ -299,8 +444,7 @@ class ReflexGate:
                         })
                         
                 # Check the reverse as well
-                if (re.search(f"\\b{pattern}\\b", logged_statement) and 
-                    re.search(f"\\b{opposite}\\b", statement)):
+                if pattern in logged_terms and opposite in terms:
                     # Potential contradiction
                     contradiction_score = logged_confidence * confidence
                     if contradiction_score > self.contradiction_threshold:
@@ -311,7 +455,7 @@ class ReflexGate:
                         })
         
         # Log the current statement
-        self.log_belief(statement, confidence)
+        self._log_entry(statement, (confidence, terms, has_trigger))
         
         return {
             "contradictions": contradictions,
@@ -342,32 +486,48 @@ class SMASDebate:
     """
     Implements SMAS (Symbolic Multi-Agent System) for internal debate simulation.
     """
+    # Opening perspective templates keyed by agent bias
+    _PERSPECTIVE_TEMPLATES = {
+        "rational": "From a logical standpoint, {topic} requires systematic analysis of the key factors involved.",
+        "innovative": "Looking at {topic} from a creative angle reveals unconventional possibilities worth exploring.",
+        "values-oriented": "When considering {topic}, we must evaluate the ethical implications and value alignments.",
+        "skeptical": "We should question underlying assumptions about {topic} and verify the evidence."
+    }
+    _DEFAULT_PERSPECTIVE = "Regarding {topic}, multiple factors need to be considered."
+    
+    # Response templates keyed by agent bias
+    _RESPONSE_TEMPLATES = {
+        "rational": "While that's one approach, a rational analysis of {topic} suggests we should consider causal relationships and evidence-based reasoning.",
+        "innovative": "Building on that view, we could explore non-obvious connections in {topic} by applying analogies from different domains.",
+        "values-oriented": "Beyond practical considerations, we should examine how {topic} impacts different stakeholders and aligns with core ethical principles.",
+        "skeptical": "I'm not convinced by that argument about {topic}. We should test these assumptions with counterexamples."
+    }
+    _DEFAULT_RESPONSE = "That's an interesting perspective on {topic}, but there are additional factors to consider."
+    
     def __init__(self):
-        # Initialize symbolic agents with different perspectives
-        self.agents = {
-            "logical": {
-                "name": "Logical Reasoner",
-                "bias": "rational",
-                "weight": 0.3
-            },
-            "creative": {
-                "name": "Creative Divergent Thinker",
-                "bias": "innovative",
-                "weight": 0.3
-            },
-            "ethical": {
-                "name": "Ethical Moderator",
-                "bias": "values-oriented",
-                "weight": 0.2
-            },
-            "skeptical": {
-                "name": "Critical Questioner",
-                "bias": "skeptical",
-                "weight": 0.2
-            }
-        }
+        # Initialize symbolic agents with different perspectives, stored as
+        # parallel tuples (one entry per agent, same order in each)
+        self.agent_ids = ("logical", "creative", "ethical", "skeptical")
+        self.agent_names = (
+            "Logical Reasoner",
+            "Creative Divergent Thinker",
+            "Ethical Moderator",
+            "Critical Questioner"
+        )
+        self.agent_biases = ("rational", "innovative", "values-oriented", "skeptical")
+        self.agent_weights = (0.3, 0.3, 0.2, 0.2)
         logger.info("SMAS Debate System initialized")
     
+    @property
+    def agents(self):
+        """Snapshot of the agents as an {agent_id: {name, bias, weight}} dict"""
+        return {
+            agent_id: {"name": name, "bias": bias, "weight": weight}
+            for agent_id, name, bias, weight in zip(
+                self.agent_ids, self.agent_names, self.agent_biases, self.agent_weights
+            )
+        }
+    
     def simulate_debate(self, topic, depth=3):
         """
         Simulate an internal debate on a topic.
@@ -384,37 +544,44 @@ class SMASDebate:
         
         debate_log = []
         
+        # Latest perspective of each agent, from the previous round,
+        # in agent order
+        prev_round = []
+        
         # Initial perspectives
-        for agent_id, agent in self.agents.items():
-            perspective = self._generate_perspective(topic, agent["bias"])
+        for name, bias in zip(self.agent_names, self.agent_biases):
+            perspective = self._generate_perspective(topic, bias)
+            prev_round.append(perspective)
             debate_log.append({
-                "agent": agent["name"],
+                "agent": name,
                 "perspective": perspective,
                 "round": 0
             })
         
         # Simulate debate rounds
         for round_num in range(1, depth + 1):
+            current_round = []
+            
             # Each agent responds to previous perspectives
-            for agent_id, agent in self.agents.items():
+            for i, (name, bias) in enumerate(zip(self.agent_names, self.agent_biases)):
                 # Get previous perspectives from other agents
-                previous_perspectives = [
-                    entry["perspective"] for entry in debate_log
-                    if entry["agent"] != agent["name"] and entry["round"] == round_num - 1
-                ]
+                previous_perspectives = prev_round[:i] + prev_round[i + 1:]
                 
                 # Generate response
                 response = self._generate_response(
                     topic, 
-                    agent["bias"], 
+                    bias, 
                     previous_perspectives
                 )
                 
+                current_round.append(response)
                 debate_log.append({
-                    "agent": agent["name"],
+                    "agent": name,
                     "perspective": response,
                     "round": round_num
                 })
+            
+            prev_round = current_round
         
         # Generate consensus
         consensus = self._generate_consensus(topic, debate_log)
@@ -438,16 +605,7 @@ class SMASDebate:
             str: Generated perspective
         """
         # Perspective generation based on bias
-        if bias == "rational":
-            return f"From a logical standpoint, {topic} requires systematic analysis of the key factors involved."
-        elif bias == "innovative":
-            return f"Looking at {topic} from a creative angle reveals unconventional possibilities worth exploring."
-        elif bias == "values-oriented":
-            return f"When considering {topic}, we must evaluate the ethical implications and value alignments."
-        elif bias == "skeptical":
-            return f"We should question underlying assumptions about {topic} and verify the evidence."
-        else:
-            return f"Regarding {topic}, multiple factors need to be considered."
+        return self._PERSPECTIVE_TEMPLATES.get(bias, self._DEFAULT_PERSPECTIVE).format(topic=topic)
     
     def _generate_response(self, topic, bias, previous_perspectives):
         """
@@ -468,21 +626,15 @@ class SMASDebate:
         target = random.choice(previous_perspectives)
         
         # Response generation based on bias
-        if bias == "rational":
-            return f"While that's one approach, a rational analysis of {topic} suggests we should consider causal relationships and evidence-based reasoning."
-        elif bias == "innovative":
-            return f"Building on that view, we could explore non-obvious connections in {topic} by applying analogies from different domains."
-        elif bias == "values-oriented":
-            return f"Beyond practical considerations, we should examine how {topic} impacts different stakeholders and aligns with core ethical principles."
-        elif bias == "skeptical":
-            return f"I'm not convinced by that argument about {topic}. We should test these assumptions with counterexamples."
-        else:
-            return f"That's an interesting perspective on {topic}, but there are additional factors to consider."
+        return self._RESPONSE_TEMPLATES.get(bias, self._DEFAULT_RESPONSE).format(topic=topic)
     
     def _generate_consensus(self, topic, debate_log):
         """
         Generate a consensus view from the debate log.
         
+        The consensus is currently a fixed synthesis of the agent
+        orientations, so only the topic is interpolated.
+        
         Args:
             topic (str): Debate topic
             debate_log (list): Full debate history
@@ -490,20 +642,10 @@ class SMASDebate:
         Returns:
             str: Consensus perspective
         """
-        # Extract final round perspectives
-        final_round = max(entry["round"] for entry in debate_log)
-        final_perspectives = [
-            entry["perspective"] for entry in debate_log
-            if entry["round"] == final_round
-        ]
-        
-        # Generate integrated consensus
-        consensus = (
+        return (
             f"After examining {topic} from multiple perspectives, a balanced view emerges: "
             f"While there are different approaches to consider, key insights include the "
             f"importance of both analytical rigor and creative thinking, ethical considerations, "
             f"and healthy skepticism of unexamined assumptions. The optimal approach likely "
             f"involves integrating these different perspectives based on the specific context."
         )
-        
-        return consensus
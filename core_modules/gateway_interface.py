@@ -13,14 +13,52 @@ All outputs are subject to integrity validation and ethical compliance enforced
 Interface de passerelle pour le moteur cognitif Neuronas.
 Gère la communication entre les composants du système.
 """
+import atexit
+import copy
 import logging
 import json
-from datetime import datetime
+import os
+import functools
+import queue
+import threading
+import time
+from collections import OrderedDict
 from flask import g
-from core_modules.core_engine import CognitiveEngine, CoreStorageManager
+from core_modules.core_engine import CognitiveEngine, CoreStorageManager, utc_timestamp
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+CONFIG_PATH = 'config.json'
+
+# Écritures de stockage groupées: taille max d'un lot et délai d'attente (s)
+STORE_BATCH_SIZE = 128
+STORE_FLUSH_INTERVAL = 0.05
+
+# Cache des réponses: nombre max d'entrées (LRU) et durée de vie (s).
+# Les réponses tirées au hasard par le moteur sont figées pendant cette durée.
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 300.0
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path, mtime):
+    """
+    Lit et analyse le fichier de configuration, mis en cache par date de modification.
+    
+    La configuration retournée est partagée entre les instances et doit être
+    traitée en lecture seule.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
 class GatewayInterface:
     """
     Interface de passerelle pour le traitement des commandes et l'interaction avec le moteur cognitif.
@@ -32,13 +70,32 @@ class GatewayInterface:
         self.cognitive_engine = CognitiveEngine()
         self.storage = CoreStorageManager()
         self._load_config()
+        
+        # Table de dispatch des commandes (voir run_command)
+        self._commands = {
+            "status": self._cmd_status,
+            "modulate": self._cmd_modulate,
+            "memory_stats": self._cmd_memory_stats
+        }
+        
+        # Cache LRU des réponses récentes: clé -> (résultat, horodatage monotone)
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        
+        # Les résultats sont stockés par lots depuis un thread dédié
+        self._store_queue = queue.Queue()
+        self._store_worker = threading.Thread(
+            target=self._drain_store_queue, name="gateway-store", daemon=True
+        )
+        self._store_worker.start()
+        # Le thread est un démon: vider la file avant l'arrêt de l'interpréteur
+        atexit.register(self.flush_storage)
     
     def _load_config(self):
         """Charge la configuration du système depuis le fichier de configuration"""
         try:
-            with open('config.json', 'r') as f:
-                self.config = json.load(f)
-                logger.info("Configuration chargée avec succès")
+            self.config = _load_config_cached(CONFIG_PATH, os.path.getmtime(CONFIG_PATH))
+            logger.info("Configuration chargée avec succès")
         except Exception as e:
             logger.warning(f"Erreur lors du chargement de la configuration: {e}")
             self.config = {
@@ -53,6 +110,11 @@ class GatewayInterface:
         """
         Traite une requête utilisateur.
         
+        Une requête répétée dans le même état cognitif (mode, focus, paramètres
+        utilisateur) reçoit la réponse en cache pendant RESPONSE_CACHE_TTL
+        secondes: une réponse choisie au hasard par le moteur reste donc la
+        même pendant cette durée.
+        
         Args:
             query (str): Requête utilisateur
             session_id (str): ID de session
@@ -65,20 +127,101 @@ class GatewayInterface:
         if user_settings:
             self.cognitive_engine.set_user_settings(user_settings)
         
-        # Traiter la requête
-        result = self.cognitive_engine.process_query(query, session_id)
+        # Une requête répétée avec le même état cognitif réutilise la réponse en cache
+        start_time = time.perf_counter()
+        cache_key = self._response_cache_key(query, user_settings)
+        result = self._get_cached_response(cache_key)
+        if result is not None:
+            # Le temps de traitement d'origine n'a plus de sens pour un hit
+            result['processing_time'] = time.perf_counter() - start_time
+        else:
+            # Traiter la requête
+            result = self.cognitive_engine.process_query(query, session_id)
+            self._cache_response(cache_key, result)
         
-        # Stocker le résultat pour référence future
+        # Stocker le résultat pour référence future (même horodatage ISO que core_engine)
         if session_id:
-            self.storage.store({
+            self._store_queue.put({
                 'query': query,
                 'response': result['response'],
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': utc_timestamp(),
                 'session_id': session_id
             })
         
         return result
     
+    def _response_cache_key(self, query, user_settings):
+        """
+        Construit la clé du cache de réponses.
+        
+        Les réponses reprennent le texte exact de la requête, la clé porte donc
+        sur la requête telle quelle, plus l'état qui influence le traitement
+        (mode, focus, paramètres utilisateur).
+        """
+        state = self.cognitive_engine.state
+        settings_key = tuple(user_settings.values()) if user_settings else None
+        return (query, state['mode'], state['focus'], settings_key)
+    
+    def _get_cached_response(self, cache_key):
+        """
+        Renvoie une copie profonde marquée cache_hit de la réponse en cache,
+        ou None si elle est absente ou a expiré.
+        """
+        with self._response_cache_lock:
+            entry = self._response_cache.get(cache_key)
+            if entry is None:
+                return None
+            result, cached_at = entry
+            if time.monotonic() - cached_at > RESPONSE_CACHE_TTL:
+                del self._response_cache[cache_key]
+                return None
+            self._response_cache.move_to_end(cache_key)
+        result = copy.deepcopy(result)
+        result['cache_hit'] = True
+        return result
+    
+    def _cache_response(self, cache_key, result):
+        """Met une réponse en cache, en évinçant la moins récemment utilisée"""
+        # Les commandes système (ex: 'modulate stim') modifient l'état: jamais en cache
+        if result.get('query_type') == 'system':
+            return
+        # Copie profonde: l'appelant peut modifier le résultat qui lui est renvoyé
+        result = copy.deepcopy(result)
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = (result, time.monotonic())
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
+    def _drain_store_queue(self):
+        """
+        Boucle du thread de stockage: regroupe jusqu'à STORE_BATCH_SIZE résultats,
+        ou ce qui arrive en STORE_FLUSH_INTERVAL secondes, et les écrit en une fois.
+        """
+        while True:
+            batch = [self._store_queue.get()]
+            deadline = time.monotonic() + STORE_FLUSH_INTERVAL
+            while len(batch) < STORE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._store_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                self.storage.store_many(batch)
+            except Exception as e:
+                logger.error(f"Erreur lors du stockage d'un lot de {len(batch)} résultats: {e}")
+            finally:
+                for _ in batch:
+                    self._store_queue.task_done()
+    
+    def flush_storage(self):
+        """Attend que tous les résultats en attente aient été stockés"""
+        self._store_queue.join()
+    
     def _get_user_settings(self):
         """
         Récupère les paramètres de l'utilisateur actuel.
@@ -107,34 +250,42 @@ class GatewayInterface:
         Returns:
             dict: Résultat de la commande
         """
-        if command == "status":
-            return {
-                "status": "ok",
-                "cognitive_engine": "active",
-                "storage": "active",
-                "mode": self.cognitive_engine.get_state()['mode']
-            }
-        elif command == "modulate":
-            mode = data if data in ["stim", "pin", "balanced"] else "balanced"
-            self.cognitive_engine.modulate(mode)
-            return {
-                "status": "ok",
-                "mode": mode,
-                "state": self.cognitive_engine.get_state()
-            }
-        elif command == "memory_stats":
-            # Cette fonction serait implémentée pour récupérer les statistiques de mémoire
-            return {
-                "status": "ok",
-                "stats": {
-                    "L1": 42,  # Nombre d'entrées dans L1 (simulations)
-                    "L2": 156,
-                    "L3": 278
-                }
-            }
-        else:
+        handler = self._commands.get(command)
+        if handler is None:
             logger.warning(f"Commande inconnue: {command}")
             return {
                 "status": "error",
                 "message": f"Commande inconnue: {command}"
-            }
\ No newline at end of file
+            }
+        return handler(data)
+    
+    def _cmd_status(self, data):
+        """Commande 'status': état des composants"""
+        return {
+            "status": "ok",
+            "cognitive_engine": "active",
+            "storage": "active",
+            "mode": self.cognitive_engine.get_state()['mode']
+        }
+    
+    def _cmd_modulate(self, data):
+        """Commande 'modulate': change le mode de modulation (stim, pin, balanced)"""
+        mode = data if data in ["stim", "pin", "balanced"] else "balanced"
+        self.cognitive_engine.modulate(mode)
+        return {
+            "status": "ok",
+            "mode": mode,
+            "state": self.cognitive_engine.get_state()
+        }
+    
+    def _cmd_memory_stats(self, data):
+        """Commande 'memory_stats': statistiques de mémoire"""
+        # Cette fonction serait implémentée pour récupérer les statistiques de mémoire
+        return {
+            "status": "ok",
+            "stats": {
+                "L1": 42,  # Nombre d'entrées dans L1 (simulations)
+                "L2": 156,
+                "L3": 278
+            }
+        }
@@ -9,14 +9,209 @@ Core modules referenced: BRONAS (Ethical Reflex Filter) and QRONAS (Probabilisti
 All outputs are subject to integrity validation and ethical compliance enforced by BRONAS.
 """
 
+import functools
+import itertools
 import logging
-import math
 import numpy as np
+from collections import defaultdict, deque
 from datetime import datetime
 
+try:
+    from scipy.special import expit
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+
+def _sigmoid(x, out=None):
+    """
+    Vectorized sigmoid activation function.
+    
+    Args:
+        x (np.ndarray): Input values
+        out (np.ndarray): Optional output array (may be x itself)
+        
+    Returns:
+        np.ndarray: Sigmoid outputs (0.0-1.0)
+    """
+    if SCIPY_AVAILABLE:
+        return expit(x, out=out)
+    # 1 / (1 + e^-x) written with tanh, which cannot overflow for large |x|
+    out = np.multiply(x, 0.5, out=out)
+    np.tanh(out, out=out)
+    out += 1.0
+    out *= 0.5
+    return out
+
+
+def _numeric_match_kernel(samples1, samples2):
+    """
+    Mean similarity of two equal-length numeric sample arrays
+    
+    Plain loop so Numba can compile it; see _numeric_match.
+    """
+    n = samples1.shape[0]
+    total_similarity = 0.0
+    for i in range(n):
+        a = samples1[i]
+        b = samples2[i]
+        max_val = max(abs(a), abs(b))
+        if max_val == 0.0:
+            total_similarity += 1.0
+        else:
+            total_similarity += 1.0 - min(1.0, abs(a - b) / max_val)
+    return total_similarity / n
+
+
+def _numeric_match_numpy(samples1, samples2):
+    """Vectorized equivalent of _numeric_match_kernel for when Numba is unavailable"""
+    max_val = np.maximum(np.abs(samples1), np.abs(samples2))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        similarity = 1.0 - np.minimum(1.0, np.abs(samples1 - samples2) / max_val)
+    similarity[max_val == 0.0] = 1.0
+    return similarity.mean()
+
+
+def _sliding_match_kernel(sequence, samples):
+    """
+    Similarity of samples against every window of sequence with the same length
+    
+    scores[w] is the _numeric_match_kernel score of sequence[w:w + len(samples)]
+    against samples, summed in the same order. Plain loop so Numba can compile it.
+    """
+    length = samples.shape[0]
+    windows = sequence.shape[0] - length + 1
+    scores = np.empty(windows)
+    for w in range(windows):
+        total_similarity = 0.0
+        for i in range(length):
+            a = sequence[w + i]
+            b = samples[i]
+            max_val = max(abs(a), abs(b))
+            if max_val == 0.0:
+                total_similarity += 1.0
+            else:
+                total_similarity += 1.0 - min(1.0, abs(a - b) / max_val)
+        scores[w] = total_similarity / length
+    return scores
+
+
+def _sliding_match_numpy(sequence, samples):
+    """Vectorized equivalent of _sliding_match_kernel for when Numba is unavailable"""
+    windows = np.lib.stride_tricks.sliding_window_view(sequence, samples.shape[0])
+    max_val = np.maximum(np.abs(windows), np.abs(samples))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        similarity = 1.0 - np.minimum(1.0, np.abs(windows - samples) / max_val)
+    similarity[max_val == 0.0] = 1.0
+    return similarity.mean(axis=1)
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: keeping the sequential sum makes results identical to the
+    # pure Python comparison
+    _numeric_match = njit(cache=True, boundscheck=False)(_numeric_match_kernel)
+    _sliding_match = njit(cache=True, boundscheck=False)(_sliding_match_kernel)
+else:
+    _numeric_match = _numeric_match_numpy
+    _sliding_match = _sliding_match_numpy
+
+
+def _is_numeric(samples):
+    """Whether every sample is compared numerically by _calculate_match"""
+    return all(isinstance(x, (int, float)) for x in samples)
+
+
+def _as_numeric_array(sequence):
+    """A float64 array copy of a numeric sequence, or None if any element is not numeric"""
+    if _is_numeric(sequence):
+        return np.asarray(sequence, dtype=np.float64)
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _golden_ratio_points(start, end, count, golden_ratio):
+    """
+    Points between start and end distributed by golden ratio, as a tuple.
+    
+    See FibonacciOptimizer.get_golden_ratio_points. Pure, so results are
+    memoized: matching re-requests the same few (length, count) pairs.
+    """
+    if count <= 1:
+        return (start,)
+    if count == 2:
+        return (start, end)
+    
+    points = [start]
+    range_size = end - start
+    
+    for i in range(1, count - 1):
+        # Calculate position using golden ratio
+        position = start + range_size * (1 - 1 / (golden_ratio ** i))
+        points.append(position)
+    
+    points.append(end)
+    return tuple(points)
+
+
+# Activations remembered per input node by HebdenIntegrator.update_connections
+ACTIVATION_HISTORY_SIZE = 10
+
+
+# Below this target size, optimize_memory_structure samples with a plain loop:
+# building the NumPy index arrays costs more than it saves
+_VECTOR_SAMPLING_MIN = 64
+
+
+@functools.lru_cache(maxsize=1024)
+def _fibonacci_distribution(target_size, fibonacci_sequence):
+    """
+    Greedy split of target_size into Fibonacci numbers, as a tuple.
+    
+    See FibonacciOptimizer._fibonacci_distribution. Memoized since compression
+    asks for the same few target sizes once per list item.
+    """
+    # Find best Fibonacci numbers that sum to target_size
+    distribution = []
+    remaining = target_size
+    
+    # Start with largest Fibonacci numbers
+    for num in reversed(fibonacci_sequence):
+        if remaining >= num:
+            count, remaining = divmod(remaining, num)
+            distribution.extend([num] * count)
+    
+    # Handle any remainder
+    if remaining > 0:
+        distribution.append(remaining)
+    
+    return tuple(distribution)
+
+
+@functools.lru_cache(maxsize=4096)
+def _golden_ratio_indices(length, count, golden_ratio):
+    """Integer indices sampling range(length) down to count golden-ratio points (read-only array)"""
+    indices = np.array([int(p) for p in _golden_ratio_points(0, length - 1, count, golden_ratio)], dtype=np.intp)
+    indices.flags.writeable = False
+    return indices
+
+
+def _hebden_warmup():
+    """Compile (or load from cache) the match kernels so the first comparison doesn't pay for it"""
+    _numeric_match(np.ones(4), np.ones(4))
+    _sliding_match(np.ones(4), np.ones(2))
+
+
+_hebden_warmup()
+
 class HebdenIntegrator:
     """
     Implements Hebden integration for synaptic-inspired learning and adaptation.
@@ -24,11 +219,59 @@ class HebdenIntegrator:
     """
     def __init__(self):
         self.learning_rate = 0.2
-        self.connection_weights = {}
-        self.activation_history = {}
+        
+        # Node id -> row/column index into the weight matrices, and back
+        self._node_ids = {}
+        self._node_names = []
+        
+        # _weights[out, in] is the weight of connection in -> out; _edges marks
+        # which connections exist, since an existing weight can be 0.0.
+        # Capacity grows in powers of two, only the first len(_node_names)
+        # rows/columns are in use.
+        self._weights = np.zeros((16, 16))
+        self._edges = np.zeros((16, 16), dtype=bool)
+        
+        # Last ACTIVATION_HISTORY_SIZE activations per input node; deques evict the oldest
+        self.activation_history = defaultdict(functools.partial(deque, maxlen=ACTIVATION_HISTORY_SIZE))
         self.hebbian_decay = 0.95
         logger.info("Hebden Integrator initialized")
     
+    @property
+    def connection_weights(self):
+        """Snapshot of the connections as an {"input:output": weight} dict"""
+        outputs, inputs = np.nonzero(self._edges)
+        names = self._node_names
+        return {
+            f"{names[i]}:{names[o]}": weight
+            for o, i, weight in zip(outputs.tolist(), inputs.tolist(), self._weights[outputs, inputs].tolist())
+        }
+    
+    def _node_index(self, node):
+        """
+        Get the matrix index of a node, registering it if new.
+        
+        Args:
+            node (str): Node ID
+            
+        Returns:
+            int: Row/column index of the node
+        """
+        idx = self._node_ids.get(node)
+        if idx is None:
+            idx = len(self._node_names)
+            capacity = len(self._weights)
+            if idx == capacity:
+                # Double capacity, keeping existing weights in place
+                weights = np.zeros((capacity * 2, capacity * 2))
+                edges = np.zeros((capacity * 2, capacity * 2), dtype=bool)
+                weights[:capacity, :capacity] = self._weights
+                edges[:capacity, :capacity] = self._edges
+                self._weights = weights
+                self._edges = edges
+            self._node_ids[node] = idx
+            self._node_names.append(node)
+        return idx
+    
     def update_connections(self, input_nodes, output_nodes, activation_values):
         """
         Update connection weights using Hebbian learning.
@@ -44,107 +287,77 @@ class HebdenIntegrator:
         if not input_nodes or not output_nodes or not activation_values:
             return {"updated": 0, "created": 0}
         
+        # Each distinct input -> output connection is updated once per call
+        inputs = list(dict.fromkeys(input_nodes))
+        outputs = list(dict.fromkeys(output_nodes))
+        in_idx = np.fromiter((self._node_index(node) for node in inputs), dtype=np.intp, count=len(inputs))
+        out_idx = np.fromiter((self._node_index(node) for node in outputs), dtype=np.intp, count=len(outputs))
+        
+        # Get activation values
+        in_vec = np.fromiter((activation_values.get(node, 0.0) for node in inputs), dtype=np.float64, count=len(inputs))
+        out_vec = np.fromiter((activation_values.get(node, 0.0) for node in outputs), dtype=np.float64, count=len(outputs))
+        
+        # Hebbian learning rule: neurons that fire together, wire together
+        delta = self.learning_rate * np.outer(out_vec, in_vec)
+        
+        # Existing connections decay before learning, new ones start at the delta
+        block = np.ix_(out_idx, in_idx)
+        existing = self._edges[block]
+        weights = self._weights[block]
+        weights *= self.hebbian_decay
+        weights[~existing] = 0.0
+        weights += delta
+        self._weights[block] = weights
+        self._edges[block] = True
+        
         # Track metrics
-        updates = 0
-        created = 0
+        updates = int(np.count_nonzero(existing))
+        created = existing.size - updates
         
-        # Update connection weights using Hebbian learning
+        # Store activation history, one entry per connection the input feeds
+        # (only the last ACTIVATION_HISTORY_SIZE of them can survive in the deque)
+        repeat = min(len(output_nodes), ACTIVATION_HISTORY_SIZE)
         for input_node in input_nodes:
-            for output_node in output_nodes:
-                connection_key = f"{input_node}:{output_node}"
-                
-                # Get activation values
-                input_activation = activation_values.get(input_node, 0.0)
-                output_activation = activation_values.get(output_node, 0.0)
-                
-                # Hebbian learning rule: neurons that fire together, wire together
-                activation_product = input_activation * output_activation
-                
-                # Update weight
-                if connection_key in self.connection_weights:
-                    # Update existing connection
-                    old_weight = self.connection_weights[connection_key]
-                    
-                    # Apply learning with decay
-                    new_weight = old_weight * self.hebbian_decay + activation_product * self.learning_rate
-                    self.connection_weights[connection_key] = new_weight
-                    updates += 1
-                else:
-                    # Create new connection
-                    self.connection_weights[connection_key] = activation_product * self.learning_rate
-                    created += 1
-                
-                # Store activation history
-                if input_node not in self.activation_history:
-                    self.activation_history[input_node] = []
-                if len(self.activation_history[input_node]) >= 10:
-                    self.activation_history[input_node].pop(0)
-                self.activation_history[input_node].append(input_activation)
-        
-        logger.debug(f"Updated {updates} connections, created {created} new connections")
+            self.activation_history[input_node].extend(
+                itertools.repeat(activation_values.get(input_node, 0.0), repeat))
+        
+        logger.debug("Updated %s connections, created %s new connections", updates, created)
         return {"updated": updates, "created": created}
     
     def propagate_activation(self, input_activations):
         """
         Propagate activation through the network.
         
+        Every node receives the weighted sum of its inputs' initial
+        activations in one step (a + W @ a).
+        
         Args:
             input_activations (dict): Initial activation values for input nodes
             
         Returns:
             dict: Resulting activation values for all nodes
         """
-        if not input_activations or not self.connection_weights:
+        if not input_activations or not self._node_names:
             return input_activations
         
-        # Initialize all activations with input values
-        all_activations = input_activations.copy()
-        
-        # Create set of all nodes
-        all_nodes = set()
-        for connection in self.connection_weights:
-            input_node, output_node = connection.split(':')
-            all_nodes.add(input_node)
-            all_nodes.add(output_node)
-        
-        # Initialize missing nodes with zero activation
-        for node in all_nodes:
-            if node not in all_activations:
-                all_activations[node] = 0.0
+        # Initialize all activations with input values, missing nodes at zero
+        n = len(self._node_names)
+        activations = np.fromiter(
+            (input_activations.get(node, 0.0) for node in self._node_names),
+            dtype=np.float64, count=n
+        )
         
         # Propagate activations through connections
-        for connection, weight in self.connection_weights.items():
-            input_node, output_node = connection.split(':')
-            
-            # Skip if input node not activated
-            if input_node not in all_activations:
-                continue
-            
-            # Propagate activation
-            input_activation = all_activations[input_node]
-            activation_delta = input_activation * weight
-            
-            # Update output node activation
-            current_output = all_activations.get(output_node, 0.0)
-            all_activations[output_node] = current_output + activation_delta
+        activations += self._weights[:n, :n] @ activations
         
-        # Apply activation function to all nodes (sigmoid)
-        for node in all_activations:
-            all_activations[node] = self._sigmoid(all_activations[node])
+        all_activations = input_activations.copy()
+        all_activations.update(zip(self._node_names, activations.tolist()))
         
-        return all_activations
-    
-    def _sigmoid(self, x):
-        """
-        Sigmoid activation function.
+        # Apply activation function to all nodes at once (sigmoid)
+        values = np.fromiter(all_activations.values(), dtype=np.float64, count=len(all_activations))
+        _sigmoid(values, out=values)
         
-        Args:
-            x (float): Input value
-            
-        Returns:
-            float: Sigmoid output (0.0-1.0)
-        """
-        return 1.0 / (1.0 + math.exp(-x))
+        return dict(zip(all_activations, values.tolist()))
     
     def get_strongest_connections(self, limit=10):
         """
@@ -156,19 +369,29 @@ class HebdenIntegrator:
         Returns:
             list: Strongest connections with weights
         """
-        # Sort connections by weight
-        sorted_connections = sorted(
-            self.connection_weights.items(),
-            key=lambda x: abs(x[1]),
-            reverse=True
-        )
+        if limit <= 0:
+            return []
+        
+        # Existing connections and their weights
+        outputs, inputs = np.nonzero(self._edges)
+        weights = self._weights[outputs, inputs]
+        magnitudes = np.abs(weights)
+        
+        # Select the top connections by |weight| without sorting them all,
+        # then order just those
+        if limit < magnitudes.size:
+            top = np.argpartition(magnitudes, -limit)[-limit:]
+        else:
+            top = np.arange(magnitudes.size)
+        top = top[np.argsort(-magnitudes[top], kind='stable')]
         
         # Return top connections
+        names = self._node_names
         return [{
-            "connection": conn,
+            "connection": f"{names[i]}:{names[o]}",
             "weight": weight,
-            "nodes": conn.split(':')
-        } for conn, weight in sorted_connections[:limit]]
+            "nodes": [names[i], names[o]]
+        } for o, i, weight in zip(outputs[top].tolist(), inputs[top].tolist(), weights[top].tolist())]
 
 class FibonacciOptimizer:
     """
@@ -217,24 +440,51 @@ class FibonacciOptimizer:
         # Calculate Fibonacci-based distribution
         distribution = self._fibonacci_distribution(target_size)
         
-        # Distribute items according to Fibonacci pattern
-        optimized = []
-        current_idx = 0
-        
-        for segment_size in distribution:
-            segment_range = len(data_points) // len(distribution)
-            segment = data_points[current_idx:current_idx + segment_range]
-            
-            # Select items from this segment
-            if segment:
-                step = len(segment) / segment_size
-                for i in range(segment_size):
-                    idx = min(len(segment) - 1, int(i * step))
-                    optimized.append(segment[idx])
-            
-            current_idx += segment_range
+        # Distribute items according to Fibonacci pattern: the sample positions
+        # of all segments are computed as one index array, then gathered at once
+        if not distribution:
+            return []
         
-        logger.debug(f"Optimized {len(data_points)} data points to {len(optimized)} using Fibonacci distribution")
+        total = len(data_points)
+        segment_range = total // len(distribution)
+        if target_size < _VECTOR_SAMPLING_MIN:
+            optimized = self._sample_segments(data_points, distribution, segment_range)
+        else:
+            segment_sizes = np.asarray(distribution, dtype=np.intp)
+            segment_starts = np.arange(len(distribution), dtype=np.intp) * segment_range
+            segment_lengths = np.minimum(segment_range, total - segment_starts)
+        
+            # Trailing segments past the end of the data contribute nothing
+            filled = segment_lengths > 0
+            segment_sizes = segment_sizes[filled]
+            segment_starts = segment_starts[filled]
+            segment_lengths = segment_lengths[filled]
+        
+            # Item i of a segment is taken at int(i * step), clamped to the segment
+            owner = np.repeat(np.arange(len(segment_sizes)), segment_sizes)
+            first_item = np.cumsum(segment_sizes) - segment_sizes
+            item = np.arange(len(owner)) - first_item[owner]
+            steps = segment_lengths / segment_sizes
+            offsets = (item * steps[owner]).astype(np.intp)
+            np.minimum(offsets, segment_lengths[owner] - 1, out=offsets)
+            indices = (offsets + segment_starts[owner]).tolist()
+            optimized = list(map(data_points.__getitem__, indices))
+        
+        logger.debug("Optimized %s data points to %s using Fibonacci distribution", len(data_points), len(optimized))
+        return optimized
+    
+    def _sample_segments(self, data_points, distribution, segment_range):
+        """Plain-loop segment sampling, cheaper than the index arrays for small targets"""
+        total = len(data_points)
+        optimized = []
+        for segment_number, segment_size in enumerate(distribution):
+            segment_start = segment_number * segment_range
+            segment_length = min(segment_range, total - segment_start)
+            if segment_length > 0:
+                step = segment_length / segment_size
+                last = segment_start + segment_length - 1
+                optimized.extend([data_points[min(last, segment_start + int(i * step))]
+                                  for i in range(segment_size)])
         return optimized
     
     def _fibonacci_distribution(self, target_size):
@@ -247,21 +497,7 @@ class FibonacciOptimizer:
         Returns:
             list: Distribution of elements per segment
         """
-        # Find best Fibonacci numbers that sum to target_size
-        distribution = []
-        remaining = target_size
-        
-        # Start with largest Fibonacci numbers
-        for num in reversed(self.fibonacci_sequence):
-            while remaining >= num:
-                distribution.append(num)
-                remaining -= num
-        
-        # Handle any remainder
-        if remaining > 0:
-            distribution.append(remaining)
-        
-        return distribution
+        return list(_fibonacci_distribution(target_size, tuple(self.fibonacci_sequence)))
     
     def optimize_compression(self, data, importance_scores):
         """
@@ -324,21 +560,7 @@ class FibonacciOptimizer:
         Returns:
             list: Points distributed by golden ratio
         """
-        if count <= 1:
-            return [start]
-        if count == 2:
-            return [start, end]
-        
-        points = [start]
-        range_size = end - start
-        
-        for i in range(1, count - 1):
-            # Calculate position using golden ratio
-            position = start + range_size * (1 - 1 / (self.golden_ratio ** i))
-            points.append(position)
-        
-        points.append(end)
-        return points
+        return list(_golden_ratio_points(start, end, count, self.golden_ratio))
 
 class PatternRecognition:
     """
@@ -369,9 +591,16 @@ class PatternRecognition:
         best_match = None
         best_score = 0.0
         
+        # Coerce once; numeric templates carry a prebuilt array
+        data_array = _as_numeric_array(data_sequence)
+        
         for pattern_id, template in self.pattern_templates.items():
             # Calculate match score
-            match_score = self._calculate_match(data_sequence, template["sequence"])
+            template_array = template.get("array")
+            if data_array is not None and template_array is not None:
+                match_score = self._calculate_numeric_match(data_array, template_array)
+            else:
+                match_score = self._calculate_match(data_sequence, template["sequence"])
             
             # Update best match
             if match_score > best_score:
@@ -388,7 +617,7 @@ class PatternRecognition:
         }
         
         if recognized:
-            logger.debug(f"Recognized pattern {best_match} with confidence {best_score:.2f}")
+            logger.debug("Recognized pattern %s with confidence %.2f", best_match, best_score)
         
         return result
     
@@ -412,17 +641,22 @@ class PatternRecognition:
         # Calculate Fibonacci-based comparison points
         if len(sequence1) > len(sequence2):
             # Downsample sequence1
-            comparison_points = self.fibonacci.get_golden_ratio_points(0, len(sequence1) - 1, len(sequence2))
-            comparison_points = [int(p) for p in comparison_points]
+            comparison_points = self._comparison_points(len(sequence1), len(sequence2))
             seq1_samples = [sequence1[i] for i in comparison_points]
             seq2_samples = sequence2
         else:
             # Downsample sequence2
-            comparison_points = self.fibonacci.get_golden_ratio_points(0, len(sequence2) - 1, len(sequence1))
-            comparison_points = [int(p) for p in comparison_points]
+            comparison_points = self._comparison_points(len(sequence2), len(sequence1))
             seq1_samples = sequence1
             seq2_samples = [sequence2[i] for i in comparison_points]
         
+        # Numeric sequences (the common case) take the compiled fast path
+        if _is_numeric(seq1_samples) and _is_numeric(seq2_samples):
+            return float(_numeric_match(
+                np.asarray(seq1_samples, dtype=np.float64),
+                np.asarray(seq2_samples, dtype=np.float64)
+            ))
+        
         # Calculate similarity
         total_similarity = 0.0
         
@@ -453,6 +687,46 @@ class PatternRecognition:
         # Calculate average similarity
         return total_similarity / len(seq1_samples)
     
+    def _calculate_numeric_match(self, array1, array2):
+        """
+        Calculate match score between two numeric sequences already held as float64 arrays.
+        
+        Same result as _calculate_match, without per-call type checks or coercion.
+        
+        Args:
+            array1 (np.ndarray): First sequence
+            array2 (np.ndarray): Second sequence
+            
+        Returns:
+            float: Match score (0.0-1.0)
+        """
+        length1 = array1.shape[0]
+        length2 = array2.shape[0]
+        
+        if min(length1, length2) == 0:
+            return 0.0
+        
+        # Downsample the longer sequence (same sampling as _calculate_match)
+        if length1 > length2:
+            array1 = array1[self._comparison_points(length1, length2)]
+        else:
+            array2 = array2[self._comparison_points(length2, length1)]
+        
+        return float(_numeric_match(array1, array2))
+    
+    def _comparison_points(self, length, count):
+        """
+        Indices sampling a sequence of the given length down to count points.
+        
+        Args:
+            length (int): Length of the sequence to downsample
+            count (int): Number of points to keep
+            
+        Returns:
+            np.ndarray: Integer indices distributed by golden ratio (read-only, shared)
+        """
+        return _golden_ratio_indices(length, count, self.fibonacci.golden_ratio)
+    
     def add_pattern_template(self, pattern_id, sequence, metadata=None):
         """
         Add a pattern template for recognition.
@@ -468,15 +742,17 @@ class PatternRecognition:
         if not sequence:
             return False
         
-        # Store pattern template
+        # Store pattern template; numeric templates also keep a float64 array
+        # so recognize_pattern can skip per-call coercion
         self.pattern_templates[pattern_id] = {
             "sequence": sequence,
+            "array": _as_numeric_array(sequence),
             "length": len(sequence),
             "added_timestamp": datetime.utcnow().isoformat(),
             "metadata": metadata or {}
         }
         
-        logger.debug(f"Added pattern template '{pattern_id}' with {len(sequence)} elements")
+        logger.debug("Added pattern template '%s' with %s elements", pattern_id, len(sequence))
         return True
     
     def extract_patterns(self, data_sequence, min_length=3, max_length=10):
@@ -496,28 +772,56 @@ class PatternRecognition:
         
         patterns = []
         
+        # Outcome per distinct window: its occurrences, or None once rejected.
+        # Occurrences depend only on the window, and a rejected window stays
+        # rejected since patterns only grow, so each distinct window is
+        # scanned once.
+        evaluated = {}
+        
+        # Numeric sequences are scanned through the array-based matcher
+        data_array = _as_numeric_array(data_sequence)
+        
         # Check for patterns of different lengths
         for length in range(min_length, min(max_length + 1, len(data_sequence))):
             # Scan through sequence
             for start in range(len(data_sequence) - length + 1):
                 candidate = data_sequence[start:start + length]
-                occurrences = self._find_occurrences(data_sequence, candidate)
+                
+                try:
+                    key = tuple(candidate)
+                    hash(key)
+                except TypeError:
+                    # Unhashable elements: evaluate every window
+                    key = None
+                
+                if key is not None and key in evaluated:
+                    occurrences = evaluated[key]
+                    if occurrences is None:
+                        continue
+                elif data_array is not None:
+                    occurrences = self._find_numeric_occurrences(
+                        data_array, data_array[start:start + length])
+                else:
+                    occurrences = self._find_occurrences(data_sequence, candidate)
                 
                 # Consider it a pattern if it occurs multiple times
-                if len(occurrences) > 1:
+                is_new = len(occurrences) > 1
+                if is_new:
                     # Check if similar pattern already extracted
-                    is_new = True
                     for existing in patterns:
                         if self._calculate_match(candidate, existing["pattern"]) > 0.8:
                             is_new = False
                             break
-                    
-                    if is_new:
-                        patterns.append({
-                            "pattern": candidate,
-                            "occurrences": occurrences,
-                            "length": length
-                        })
+                
+                if is_new:
+                    patterns.append({
+                        "pattern": candidate,
+                        "occurrences": list(occurrences),
+                        "length": length
+                    })
+                
+                if key is not None:
+                    evaluated[key] = occurrences if is_new else None
         
         # Sort by number of occurrences
         patterns.sort(key=lambda x: len(x["occurrences"]), reverse=True)
@@ -535,6 +839,13 @@ class PatternRecognition:
         Returns:
             list: Starting indices of pattern occurrences
         """
+        # Numeric sequences (the common case) score every window at once
+        sequence_array = _as_numeric_array(sequence)
+        if sequence_array is not None:
+            pattern_array = _as_numeric_array(pattern)
+            if pattern_array is not None:
+                return self._find_numeric_occurrences(sequence_array, pattern_array)
+        
         occurrences = []
         
         # Scan through sequence
@@ -546,3 +857,26 @@ class PatternRecognition:
                 occurrences.append(i)
         
         return occurrences
+    
+    def _find_numeric_occurrences(self, sequence_array, pattern_array):
+        """
+        Find all occurrences of a pattern in a sequence, both held as float64 arrays.
+        
+        Same result as _find_occurrences: each window is compared with the
+        pattern sampled at its golden-ratio points, as _calculate_match does
+        for equal lengths, but all windows are scored in one kernel call.
+        
+        Args:
+            sequence_array (np.ndarray): Data sequence
+            pattern_array (np.ndarray): Pattern to find
+            
+        Returns:
+            list: Starting indices of pattern occurrences
+        """
+        length = pattern_array.shape[0]
+        if length == 0 or length > sequence_array.shape[0]:
+            return []
+        
+        samples = pattern_array[self._comparison_points(length, length)]
+        scores = _sliding_match(sequence_array, samples)
+        return np.flatnonzero(scores > self.recognition_threshold).tolist()
@@ -0,0 +1,24 @@
+"""
+This work is licensed under CC BY-NC 4.0 International.
+Commercial use requires prior written consent and compensation.
+Contact: sebastienbrulotte@gmail.com
+Attribution: Sebastien Brulotte aka [ Doditz ]
+
+This document is part of the NEURONAS cognitive system.
+Core modules referenced: BRONAS (Ethical Reflex Filter) and QRONAS (Probabilistic Symbolic Vector Engine).
+All outputs are subject to integrity validation and ethical compliance enforced by BRONAS.
+"""
+
+
+"""
+Metrics snapshot type shared by the core modules
+"""
+
+from types import SimpleNamespace
+
+
+class MetricsSnapshot(SimpleNamespace):
+    """Metrics read at one point in time, as attributes; use as_dict() for a JSON-ready copy"""
+    
+    def as_dict(self):
+        return dict(vars(self))
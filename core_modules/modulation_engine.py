@@ -9,9 +9,12 @@ Core modules referenced: BRONAS (Ethical Reflex Filter) and QRONAS (Probabilisti
 All outputs are subject to integrity validation and ethical compliance enforced by BRONAS.
 """
 
+import bisect
 import logging
 import math
 import random
+import time
+import numpy as np
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -37,32 +40,34 @@ class ModulationEngine:
         self.initialized = True
         logger.info("Modulation Engine initialized")
     
-    def modulate_d2(self, mode, intensity=0.3):
+    def modulate_d2(self, mode, intensity=0.3, round_values=False):
         """
         Apply dopaminergic modulation based on specified mode.
         
         Args:
             mode (str): Modulation mode ('stim', 'pin', or 'baseline')
             intensity (float): Modulation intensity (0.0-1.0)
+            round_values (bool): Round state values to 2 decimals (for display)
             
         Returns:
             dict: Updated cognitive state values
         """
         # Apply appropriate modulation
         if mode == "stim":
-            return self.apply_stimulation(intensity)
+            return self.apply_stimulation(intensity, round_values=round_values)
         elif mode == "pin":
-            return self.apply_inhibition(intensity)
+            return self.apply_inhibition(intensity, round_values=round_values)
         else:
             return self.reset_baseline()
     
-    def apply_stimulation(self, intensity=0.3, region="prefrontal_cortex"):
+    def apply_stimulation(self, intensity=0.3, region="prefrontal_cortex", round_values=False):
         """
         Apply D2Stim stimulation to enhance cognitive processing.
         
         Args:
             intensity (float): Stimulation intensity (0.0-1.0)
             region (str): Target brain region (for future enhancement)
+            round_values (bool): Round state values to 2 decimals (for display)
             
         Returns:
             dict: Updated cognitive state
@@ -87,21 +92,16 @@ class ModulationEngine:
             self.working_memory - intensity * 0.2
         )
         
-        logger.debug(f"Applied D2Stim with intensity {intensity}")
-        return {
-            "d2_activation": round(self.d2_activation, 2),
-            "attention": round(self.attention, 2),
-            "working_memory": round(self.working_memory, 2),
-            "mode": "stim",
-            "intensity": intensity
-        }
+        logger.debug("Applied D2Stim with intensity %s", intensity)
+        return self._state_result("stim", intensity, round_values)
     
-    def apply_inhibition(self, intensity=0.3):
+    def apply_inhibition(self, intensity=0.3, round_values=False):
         """
         Apply D2Pin inhibition to focus cognitive processing.
         
         Args:
             intensity (float): Inhibition intensity (0.0-1.0)
+            round_values (bool): Round state values to 2 decimals (for display)
             
         Returns:
             dict: Updated cognitive state
@@ -132,13 +132,37 @@ class ModulationEngine:
                 self.attention - attention_modifier
             )
         
-        logger.debug(f"Applied D2Pin with intensity {intensity}")
+        logger.debug("Applied D2Pin with intensity %s", intensity)
+        return self._state_result("pin", intensity, round_values)
+    
+    def _state_result(self, mode, intensity, round_values):
+        """
+        Build the cognitive state dict returned by a modulation.
+        
+        Values stay raw on the compute path; rounding is only paid when the
+        caller asks for display values.
+        """
+        if round_values:
+            return dict(self._format_state(), mode=mode, intensity=intensity)
+        return {
+            "d2_activation": self.d2_activation,
+            "attention": self.attention,
+            "working_memory": self.working_memory,
+            "mode": mode,
+            "intensity": intensity
+        }
+    
+    def _format_state(self):
+        """
+        Current cognitive state rounded to 2 decimals, for display and logs.
+        
+        Returns:
+            dict: Rounded d2_activation, attention and working_memory
+        """
         return {
             "d2_activation": round(self.d2_activation, 2),
             "attention": round(self.attention, 2),
-            "working_memory": round(self.working_memory, 2),
-            "mode": "pin",
-            "intensity": intensity
+            "working_memory": round(self.working_memory, 2)
         }
     
     def reset_baseline(self):
@@ -172,8 +196,32 @@ class QuACEngine:
             'L2': 0.6,  # Medium importance for L2
             'L3': 0.0   # Everything else goes to L3
         }
+        
+        # Keys cached in each tier (dicts used as ordered sets)
+        self._tier_keys = {tier: {} for tier in self.tier_thresholds}
+        
+        # Bisect lookup built from tier_thresholds (see _update_tier_lookup)
+        self._tier_snapshot = None
+        self._update_tier_lookup()
+        
         logger.info("QuAC Engine initialized")
     
+    def _update_tier_lookup(self):
+        """
+        Rebuild the bisect tier lookup if tier_thresholds changed since it was built.
+        
+        The lowest tier takes everything else, each higher tier takes
+        importances strictly above its threshold.
+        """
+        if self.tier_thresholds == self._tier_snapshot:
+            return
+        ranked = sorted(self.tier_thresholds, key=self.tier_thresholds.get)
+        self._tier_names = tuple(ranked)
+        self._tier_cutoffs = tuple(self.tier_thresholds[tier] for tier in ranked[1:])
+        for tier in ranked:
+            self._tier_keys.setdefault(tier, {})
+        self._tier_snapshot = dict(self.tier_thresholds)
+    
     def cache_data(self, key, value, importance):
         """
         Cache data with adaptive tier selection based on importance.
@@ -186,18 +234,18 @@ class QuACEngine:
         Returns:
             str: Selected memory tier
         """
-        # Select tier based on importance
-        if importance > self.tier_thresholds['L1']:
-            tier = "L1"
-        elif importance > self.tier_thresholds['L2']:
-            tier = "L2"
-        else:
-            tier = "L3"
+        # Select tier based on importance: number of thresholds it exceeds
+        self._update_tier_lookup()
+        tier = self._tier_names[bisect.bisect_left(self._tier_cutoffs, importance)]
         
-        # Store in cache
+        # Store in cache, moving the key between tiers if it was cached before
+        previous = self.cache.get(key)
+        if previous is not None and previous[1] != tier:
+            del self._tier_keys[previous[1]][key]
+        self._tier_keys[tier][key] = None
         self.cache[key] = (value, tier, importance)
         
-        logger.debug(f"Cached data with key {key} to tier {tier}")
+        logger.debug("Cached data with key %s to tier %s", key, tier)
         return tier
     
     def retrieve_data(self, key):
@@ -224,10 +272,8 @@ class QuACEngine:
         Returns:
             dict: Data from the specified tier
         """
-        return {
-            k: v for k, (v, t, i) in self.cache.items()
-            if t == tier
-        }
+        cache = self.cache
+        return {k: cache[k][0] for k in self._tier_keys.get(tier, ())}
 
 class QDACache:
     """
@@ -235,6 +281,14 @@ class QDACache:
     """
     def __init__(self):
         self.memory = {}
+        
+        # Scores live in one array so decay is a single vector multiply.
+        # _scores[_key_index[key]] is the score of memory[key]; the entry's
+        # 'score' field is refreshed when get_top_memories returns it.
+        self._keys = []
+        self._key_index = {}
+        self._scores = np.zeros(16)
+        
         self.scoring_weights = {
             'length': 0.3,
             'd2_level': 0.4,
@@ -256,19 +310,19 @@ class QDACache:
         if not data:
             return 0.0
         
+        weights = self.scoring_weights
+        
         # Calculate base score from content length
-        length_score = min(1.0, len(data) / 1000) * self.scoring_weights['length']
+        length_score = min(1.0, len(data) / 1000) * weights['length']
         
         # Calculate D2 modulated score - higher D2 favors certain content types
-        d2_mod = math.sin(d2_level * math.pi) * self.scoring_weights['d2_level']
-        
-        # Recency is set to maximum for new entries
-        recency_score = 1.0 * self.scoring_weights['recency']
+        d2_mod = math.sin(d2_level * math.pi) * weights['d2_level']
         
-        # Calculate total score
-        total_score = length_score + d2_mod + recency_score
+        # Recency is set to maximum (1.0) for new entries
+        recency_score = weights['recency']
         
-        return round(total_score, 3)
+        # Calculate total score (unrounded; round at display time)
+        return length_score + d2_mod + recency_score
     
     def store_scored_memory(self, key, data, d2_level):
         """
@@ -286,7 +340,6 @@ class QDACache:
         score = self.score_entry(data, d2_level)
         
         # Store in memory with timestamp
-        import time
         self.memory[key] = {
             'data': data,
             'score': score,
@@ -294,7 +347,16 @@ class QDACache:
             'timestamp': time.time()
         }
         
-        logger.debug(f"Stored memory with key {key} and score {score}")
+        index = self._key_index.get(key)
+        if index is None:
+            index = len(self._keys)
+            if index == self._scores.shape[0]:
+                self._scores = np.concatenate([self._scores, np.zeros(index)])
+            self._key_index[key] = index
+            self._keys.append(key)
+        self._scores[index] = score
+        
+        logger.debug("Stored memory with key %s and score %s", key, score)
         return score
     
     def decay_scores(self, decay_rate=0.05):
@@ -307,12 +369,10 @@ class QDACache:
         Returns:
             int: Number of entries affected
         """
-        count = 0
-        for key in self.memory:
-            self.memory[key]['score'] *= (1 - decay_rate)
-            count += 1
+        count = len(self._keys)
+        self._scores[:count] *= (1 - decay_rate)
         
-        logger.debug(f"Applied decay to {count} memory entries")
+        logger.debug("Applied decay to %s memory entries", count)
         return count
     
     def get_top_memories(self, limit=10):
@@ -325,12 +385,28 @@ class QDACache:
         Returns:
             list: Top memory entries
         """
-        # Sort by score
-        sorted_memories = sorted(
-            self.memory.items(), 
-            key=lambda x: x[1]['score'],
-            reverse=True
-        )
+        count = len(self._keys)
+        if limit < 0:
+            # Same as slicing the sorted list with a negative limit
+            limit = max(0, count + limit)
+        if count == 0 or limit == 0:
+            return []
+        scores = self._scores[:count]
+        
+        # Only entries scoring at least the limit-th best can make the cut;
+        # ties keep insertion order, as a stable sort by descending score would
+        if limit < count:
+            cutoff = np.partition(scores, count - limit)[count - limit]
+            candidates = np.flatnonzero(scores >= cutoff)
+        else:
+            candidates = np.arange(count)
+        order = candidates[np.argsort(-scores[candidates], kind='stable')][:limit]
         
-        # Return top entries
-        return sorted_memories[:limit]
+        # Return top entries, with their current score
+        top_memories = []
+        for index in order.tolist():
+            key = self._keys[index]
+            entry = self.memory[key]
+            entry['score'] = float(scores[index])
+            top_memories.append((key, entry))
+        return top_memories
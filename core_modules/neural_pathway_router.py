@@ -15,10 +15,66 @@ Neural Pathway Router for Neuronas AI
 Implements neuromorphic pathway routing for cognitive processing
 """
 
+import functools
 import numpy as np
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict, deque
 import random
 
+# History kept by NeuralPathwayRouter: recent routing decisions, and
+# recent processing metrics per pathway (the window get_pathway_metrics averages)
+ACTIVITY_LOG_SIZE = 10000
+PATHWAY_METRICS_WINDOW = 1024
+
+
+# Feature extraction for classify_query: (category, terms) matched as substrings
+_CLASSIFICATION_TERMS = (
+    ("creative", ("create", "design", "imagine", "innovative", "novel", "artistic", "dream")),
+    ("analytical", ("analyze", "compare", "evaluate", "reason", "logic", "why", "how")),
+    ("factual", ("what", "when", "where", "who", "facts", "information", "history")),
+    ("regulatory", ("balance", "maintain", "regulate", "adjust", "optimize", "control"))
+)
+
+
+# Width of the cross-talk range in select_pathway, computed as random.uniform does
+_CROSS_TALK_SPAN = 0.2 - 0.05
+
+
+@functools.lru_cache(maxsize=2048)
+def _classify_query_text(query_lower):
+    """
+    Keyword classification of a lowercased query, see NeuralPathwayRouter.classify_query.
+    
+    Pure in the query text, so it is memoized for repeated queries.
+    
+    Returns:
+        tuple: (top_class, confidence, ((category, normalized_score), ...))
+    """
+    # Simple keyword-based classification (would be more sophisticated in real system)
+    # Calculate scores: number of distinct category terms found in the query
+    scores = {}
+    for category, terms in _CLASSIFICATION_TERMS:
+        count = 0
+        for term in terms:
+            if term in query_lower:
+                count += 1
+        scores[category] = count
+    
+    # Normalize scores
+    total = sum(scores.values()) + 0.001  # Avoid division by zero
+    normalized_scores = {k: v/total for k, v in scores.items()}
+    
+    # Find top classification
+    top_class = max(normalized_scores, key=normalized_scores.get)
+    
+    # Apply threshold
+    threshold = 0.4
+    if normalized_scores[top_class] < threshold:
+        # If no clear classification, default to analytical
+        top_class = "analytical"
+    
+    return top_class, normalized_scores[top_class], tuple(normalized_scores.items())
+
+
 class NeuralPathwayRouter:
     def __init__(self, architecture_config=None):
         """Initialize the Neural Pathway Router"""
@@ -68,9 +124,22 @@ class NeuralPathwayRouter:
             "regulatory": "tuberoinfundibular"
         }
         
-        # Track activity and performance
-        self.activity_log = []
-        self.performance_metrics = defaultdict(list)
+        # Processing effect per pathway specialization (see process_through_pathway)
+        self._processing_effects = {
+            "factual_processing": self._apply_factual_processing,
+            "creative_processing": self._apply_creative_processing,
+            "analytical_processing": self._apply_analytical_processing,
+            "regulatory_processing": self._apply_regulatory_processing
+        }
+        
+        # Track activity and performance over bounded windows
+        self.activity_log = deque(maxlen=ACTIVITY_LOG_SIZE)
+        self.performance_metrics = defaultdict(functools.partial(deque, maxlen=PATHWAY_METRICS_WINDOW))
+        
+        # Running [activation, processing_time] sums over each metrics window,
+        # and lifetime usage counts (the window only holds the latest entries)
+        self._metric_sums = defaultdict(lambda: [0.0, 0.0])
+        self._usage_counts = defaultdict(int)
     
     def classify_query(self, query_text):
         """
@@ -82,51 +151,48 @@ class NeuralPathwayRouter:
         Returns:
             Dictionary with classification results
         """
-        # Simple keyword-based classification (would be more sophisticated in real system)
-        query_lower = query_text.lower()
-        
-        # Feature extraction
-        features = {
-            "creative_terms": ["create", "design", "imagine", "innovative", "novel", "artistic", "dream"],
-            "analytical_terms": ["analyze", "compare", "evaluate", "reason", "logic", "why", "how"],
-            "factual_terms": ["what", "when", "where", "who", "facts", "information", "history"],
-            "regulatory_terms": ["balance", "maintain", "regulate", "adjust", "optimize", "control"]
-        }
-        
-        # Calculate scores
-        scores = {
-            "creative": sum(1 for term in features["creative_terms"] if term in query_lower),
-            "analytical": sum(1 for term in features["analytical_terms"] if term in query_lower),
-            "factual": sum(1 for term in features["factual_terms"] if term in query_lower),
-            "regulatory": sum(1 for term in features["regulatory_terms"] if term in query_lower)
+        top_class, confidence, scores = _classify_query_text(query_text.lower())
+        return {
+            "classification": top_class,
+            "confidence": confidence,
+            "scores": dict(scores)
         }
+    
+    def classify_queries(self, queries):
+        """
+        Classify several queries at once (e.g. a chat session or a replay)
         
-        # Normalize scores
-        total = sum(scores.values()) + 0.001  # Avoid division by zero
-        normalized_scores = {k: v/total for k, v in scores.items()}
-        
-        # Find top classification
-        top_class = max(normalized_scores, key=normalized_scores.get)
+        Each distinct query is classified once; repeats share its result.
         
-        # Apply threshold
-        threshold = 0.4
-        if normalized_scores[top_class] < threshold:
-            # If no clear classification, default to analytical
-            top_class = "analytical"
+        Args:
+            queries: Iterable of query texts
             
-        return {
-            "classification": top_class,
-            "confidence": normalized_scores[top_class],
-            "scores": normalized_scores
-        }
+        Returns:
+            List of classification dictionaries, in query order
+        """
+        lowered = [query_text.lower() for query_text in queries]
+        classified = {text: _classify_query_text(text) for text in dict.fromkeys(lowered)}
+        
+        results = []
+        for text in lowered:
+            top_class, confidence, scores = classified[text]
+            results.append({
+                "classification": top_class,
+                "confidence": confidence,
+                "scores": dict(scores)
+            })
+        return results
     
-    def select_pathway(self, query_classification, d2_activation=0.5):
+    def select_pathway(self, query_classification, d2_activation=0.5, with_cross_talk=False):
         """
         Select and activate a neural pathway based on query classification
         
         Args:
             query_classification: Classification result from classify_query
             d2_activation: Current D2 activation level (0-1)
+            with_cross_talk: Also give the other pathways a random secondary
+                activation; otherwise they are reset to 0.0. Processing only
+                uses the primary activation, so this is for introspection.
             
         Returns:
             Selected pathway and activation level
@@ -140,15 +206,16 @@ class NeuralPathwayRouter:
         # Calculate activation based on confidence and D2 levels
         activation_level = confidence * (0.7 + d2_activation * 0.3)
         
-        # Activate primary pathway
-        self.pathways[primary_pathway]["current_activation"] = activation_level
-        
-        # Secondary activation for related pathways (simulating neural cross-talk)
-        for pathway in self.pathways:
-            if pathway != primary_pathway:
-                # Random small activation (cross-talk)
-                cross_talk = random.uniform(0.05, 0.2) * activation_level
-                self.pathways[pathway]["current_activation"] = cross_talk
+        # Activate primary pathway; on request, related pathways get secondary
+        # activation (simulating neural cross-talk)
+        for pathway, info in self.pathways.items():
+            if pathway == primary_pathway:
+                info["current_activation"] = activation_level
+            elif with_cross_talk:
+                # Random small activation (cross-talk), as random.uniform(0.05, 0.2)
+                info["current_activation"] = (0.05 + _CROSS_TALK_SPAN * random.random()) * activation_level
+            else:
+                info["current_activation"] = 0.0
         
         # Log activity
         self.activity_log.append({
@@ -197,26 +264,35 @@ class NeuralPathwayRouter:
         # Full processing
         specialization = pathway_info["specialization"]
         
-        # Simulate processing effects
-        processing_effects = {
-            "factual_processing": self._apply_factual_processing,
-            "creative_processing": self._apply_creative_processing,
-            "analytical_processing": self._apply_analytical_processing,
-            "regulatory_processing": self._apply_regulatory_processing
-        }
-        
-        # Apply specialization effect
-        if specialization in processing_effects:
-            processed_content = processing_effects[specialization](content, activation_level)
+        # Apply specialization effect (simulated processing)
+        effect = self._processing_effects.get(specialization)
+        if effect is not None:
+            processed_content = effect(content, activation_level)
         else:
             processed_content = content
             
-        # Record performance metrics
-        self.performance_metrics[pathway].append({
+        # Record performance metrics, keeping the window sums in step
+        metric = {
             "activation": activation_level,
             "content_length": len(content) if isinstance(content, str) else 0,
             "processing_time": random.uniform(0.1, 0.5)  # Simulated processing time
-        })
+        }
+        window = self.performance_metrics[pathway]
+        sums = self._metric_sums[pathway]
+        if len(window) == window.maxlen:
+            evicted = window[0]
+            sums[0] -= evicted["activation"]
+            sums[1] -= evicted["processing_time"]
+        window.append(metric)
+        self._usage_counts[pathway] += 1
+        if self._usage_counts[pathway] % window.maxlen == 0:
+            # Once per full turn of the window, recompute the sums from it so
+            # the add/subtract rounding error cannot accumulate
+            sums[0] = sum(m["activation"] for m in window)
+            sums[1] = sum(m["processing_time"] for m in window)
+        else:
+            sums[0] += metric["activation"]
+            sums[1] += metric["processing_time"]
         
         return processed_content, {
             "pathway": pathway,
@@ -264,11 +340,12 @@ class NeuralPathwayRouter:
                 }
                 continue
                 
-            pathway_metrics = self.performance_metrics[pathway]
+            window_size = len(self.performance_metrics[pathway])
+            activation_sum, time_sum = self._metric_sums[pathway]
             metrics[pathway] = {
-                "activation_avg": sum(m["activation"] for m in pathway_metrics) / len(pathway_metrics),
-                "usage_count": len(pathway_metrics),
-                "avg_processing_time": sum(m["processing_time"] for m in pathway_metrics) / len(pathway_metrics),
+                "activation_avg": activation_sum / window_size,
+                "usage_count": self._usage_counts[pathway],
+                "avg_processing_time": time_sum / window_size,
                 "specialization": data["specialization"]
             }
             
@@ -9,12 +9,87 @@ Core modules referenced: BRONAS (Ethical Reflex Filter) and QRONAS (Probabilisti
 All outputs are subject to integrity validation and ethical compliance enforced by BRONAS.
 """
 
+import bisect
+import functools
+import itertools
 import logging
 import random
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Pathway weights per query type, as cumulative tuples (see _weighted_index)
+_LEFT_PATHWAY_CUM_WEIGHTS = {
+    # Prioritize factual retrieval for factual queries
+    'factual': tuple(itertools.accumulate([0.1, 0.1, 0.6, 0.1, 0.1])),
+    # Prioritize analytical reasoning and logical deduction
+    'analytical': tuple(itertools.accumulate([0.4, 0.3, 0.1, 0.1, 0.1])),
+    # Balanced for creative (and any other) queries
+    'creative': tuple(itertools.accumulate([0.2, 0.2, 0.2, 0.2, 0.2]))
+}
+_RIGHT_PATHWAY_CUM_WEIGHTS = {
+    # Prioritize creative divergence and conceptual blending
+    'creative': tuple(itertools.accumulate([0.4, 0.1, 0.1, 0.1, 0.3])),
+    # Prioritize abstract synthesis and intuitive reasoning
+    'analytical': tuple(itertools.accumulate([0.1, 0.4, 0.3, 0.1, 0.1])),
+    # Prioritize narrative generation for factual (and any other) queries
+    'factual': tuple(itertools.accumulate([0.1, 0.2, 0.1, 0.5, 0.1]))
+}
+
+
+def _weighted_index(cum_weights):
+    """
+    Index drawn with probability proportional to the weights behind cum_weights.
+    
+    Same single random() draw and bisection as random.choices, without
+    re-accumulating the weights on every call.
+    """
+    return bisect.bisect(cum_weights, random.random() * cum_weights[-1], 0, len(cum_weights) - 1)
+
+
+@functools.lru_cache(maxsize=256)
+def _hemisphere_weights(base_l, base_r, d2_activation):
+    """
+    (L, R) hemisphere weights after D2 adjustment, see route_neural_pathway.
+    
+    Pure in the base weights and D2 level, which change rarely, so memoized.
+    """
+    # Apply D2 activation adjustment to weights
+    # Higher D2 activation favors right hemisphere
+    d2_modifier = (d2_activation - 0.5) * 0.4
+    
+    # Ensure weights remain valid probabilities
+    weight_l = max(0.1, min(0.9, base_l - d2_modifier))
+    weight_r = max(0.1, min(0.9, base_r + d2_modifier))
+    return weight_l, weight_r
+
+
+# Stop words/common words, encoded -1 by D2SpinMemory
+_STOP_WORDS = frozenset(["the", "and", "a", "of", "in", "to", "is", "it"])
+
+
+@functools.lru_cache(maxsize=8192)
+def _encode_token(token):
+    """
+    D2Spin encoding of a token, see D2SpinMemory.encode.
+    
+    Pure in the token, so it is memoized: the same words recur across texts.
+    """
+    # Simple encoding strategy:
+    # 1: Important tokens (longer than 6 chars)
+    # -1: Stop words/common words
+    # 0: Neutral tokens
+    
+    if not token:
+        return 0
+        
+    if len(token) > 6:
+        return 1
+    elif token.lower() in _STOP_WORDS:
+        return -1
+    else:
+        return 0
+
 class NeuralPathwayRouter:
     """
     Routes cognitive processing through specialized neural pathways.
@@ -63,26 +138,17 @@ class NeuralPathwayRouter:
             tuple: (hemisphere, pathway) to be used for processing
         """
         # Get hemisphere weights for query type
-        weights = self.hemisphere_bias.get(
-            query_type, 
-            {'L': 0.5, 'R': 0.5}  # Default to balanced
-        )
-        
-        # Apply D2 activation adjustment to weights
-        # Higher D2 activation favors right hemisphere
-        d2_modifier = (self.d2_activation - 0.5) * 0.4
-        weights['R'] += d2_modifier
-        weights['L'] -= d2_modifier
-        
-        # Ensure weights remain valid probabilities
-        weights['L'] = max(0.1, min(0.9, weights['L']))
-        weights['R'] = max(0.1, min(0.9, weights['R']))
-        
-        # Choose hemisphere based on weights
-        hemisphere = random.choices(
-            ['L', 'R'], 
-            weights=[weights['L'], weights['R']]
-        )[0]
+        base = self.hemisphere_bias.get(query_type)
+        if base is None:
+            weight_l, weight_r = _hemisphere_weights(0.5, 0.5, self.d2_activation)  # Default to balanced
+        else:
+            weight_l, weight_r = _hemisphere_weights(base['L'], base['R'], self.d2_activation)
+        
+        # Choose hemisphere based on weights (same draw as random.choices)
+        if random.random() * (weight_l + weight_r) < weight_l:
+            hemisphere = 'L'
+        else:
+            hemisphere = 'R'
         
         # Select appropriate pathway for the hemisphere
         if hemisphere == 'L':
@@ -90,7 +156,7 @@ class NeuralPathwayRouter:
         else:
             pathway = self._select_right_pathway(query_type)
         
-        logger.debug(f"Routed to {hemisphere} hemisphere using {pathway} pathway")
+        logger.debug("Routed to %s hemisphere using %s pathway", hemisphere, pathway)
         return hemisphere, pathway
     
     def _select_left_pathway(self, query_type):
@@ -103,18 +169,8 @@ class NeuralPathwayRouter:
         Returns:
             str: Selected pathway
         """
-        if query_type == 'factual':
-            # Prioritize factual retrieval for factual queries
-            weights = [0.1, 0.1, 0.6, 0.1, 0.1]
-        elif query_type == 'analytical':
-            # Prioritize analytical reasoning and logical deduction
-            weights = [0.4, 0.3, 0.1, 0.1, 0.1]
-        else:
-            # Balanced for creative queries
-            weights = [0.2, 0.2, 0.2, 0.2, 0.2]
-        
-        # Select pathway based on weights
-        return random.choices(self.left_pathways, weights=weights)[0]
+        cum_weights = _LEFT_PATHWAY_CUM_WEIGHTS.get(query_type, _LEFT_PATHWAY_CUM_WEIGHTS['creative'])
+        return self.left_pathways[_weighted_index(cum_weights)]
     
     def _select_right_pathway(self, query_type):
         """
@@ -126,18 +182,8 @@ class NeuralPathwayRouter:
         Returns:
             str: Selected pathway
         """
-        if query_type == 'creative':
-            # Prioritize creative divergence and conceptual blending
-            weights = [0.4, 0.1, 0.1, 0.1, 0.3]
-        elif query_type == 'analytical':
-            # Prioritize abstract synthesis and intuitive reasoning
-            weights = [0.1, 0.4, 0.3, 0.1, 0.1]
-        else:
-            # Prioritize narrative generation for factual queries
-            weights = [0.1, 0.2, 0.1, 0.5, 0.1]
-        
-        # Select pathway based on weights
-        return random.choices(self.right_pathways, weights=weights)[0]
+        cum_weights = _RIGHT_PATHWAY_CUM_WEIGHTS.get(query_type, _RIGHT_PATHWAY_CUM_WEIGHTS['factual'])
+        return self.right_pathways[_weighted_index(cum_weights)]
     
     def update_d2_activation(self, activation_level):
         """
@@ -151,7 +197,7 @@ class NeuralPathwayRouter:
         """
         # Ensure activation level is within bounds
         self.d2_activation = max(0.0, min(1.0, activation_level))
-        logger.debug(f"D2 activation updated to {self.d2_activation}")
+        logger.debug("D2 activation updated to %s", self.d2_activation)
         return self.d2_activation
 
 class D2SpinMemory:
@@ -160,6 +206,11 @@ class D2SpinMemory:
     """
     def __init__(self):
         self.memory = {}
+        
+        # Inverted index: encoding value -> tokens with that encoding, as dicts
+        # used as ordered sets so retrieval keeps memory's insertion order
+        self._tokens_by_encoding = {-1: {}, 0: {}, 1: {}}
+        
         self.activation = 0.5
         logger.info("D2Spin Memory initialized")
     
@@ -173,20 +224,7 @@ class D2SpinMemory:
         Returns:
             int: Encoding value (-1, 0, or 1)
         """
-        # Simple encoding strategy:
-        # 1: Important tokens (longer than 6 chars)
-        # -1: Stop words/common words
-        # 0: Neutral tokens
-        
-        if not token:
-            return 0
-            
-        if len(token) > 6:
-            return 1
-        elif token.lower() in ["the", "and", "a", "of", "in", "to", "is", "it"]:
-            return -1
-        else:
-            return 0
+        return _encode_token(token)
     
     def store_tokens(self, tokens):
         """
@@ -201,11 +239,18 @@ class D2SpinMemory:
         if not tokens:
             return {}
             
-        # Encode each token
-        encodings = {t: self.encode(t) for t in tokens}
+        # Encode each distinct token once, in first-seen order
+        unique_tokens = dict.fromkeys(tokens)
+        encodings = dict(zip(unique_tokens, map(_encode_token, unique_tokens)))
         
-        # Update memory with new encodings
-        self.memory.update(encodings)
+        # Update memory with new encodings; a token's encoding never changes,
+        # so only tokens seen for the first time join an index bucket
+        memory = self.memory
+        buckets = self._tokens_by_encoding
+        for token, encoding in encodings.items():
+            if token not in memory:
+                buckets[encoding][token] = None
+        memory.update(encodings)
         
         return encodings
     
@@ -219,13 +264,8 @@ class D2SpinMemory:
         Returns:
             list: Matching tokens
         """
-        # Find tokens with matching encoding
-        matching_tokens = [
-            token for token, encoding in self.memory.items()
-            if encoding == encoding_value
-        ]
-        
-        return matching_tokens
+        # Tokens with matching encoding, from the inverted index
+        return list(self._tokens_by_encoding.get(encoding_value, ()))
     
     def get_activation_level(self):
         """
@@ -178,6 +178,7 @@ class QkismModel:
     """
     def __init__(self):
         self.knowledge = {}
+        # (concept1, relation, concept2) -> strength
         self.symbolic_relations = {}
         self.truth_thresholds = {
             'high': 0.8,
@@ -199,7 +200,7 @@ class QkismModel:
         """
         # Store rule with truth value
         self.knowledge[concept] = max(0.0, min(1.0, truth))
-        logger.debug(f"Added rule '{concept}' with truth {truth}")
+        logger.debug("Added rule '%s' with truth %s", concept, truth)
         return truth
     
     def query(self, concept):
@@ -228,12 +229,12 @@ class QkismModel:
             dict: Added relation
         """
         # Create relation key
-        relation_key = f"{concept1}:{relation}:{concept2}"
+        relation_key = (concept1, relation, concept2)
         
         # Store relation
         self.symbolic_relations[relation_key] = max(0.0, min(1.0, strength))
         
-        logger.debug(f"Added symbolic relation '{relation_key}' with strength {strength}")
+        logger.debug("Added symbolic relation '%s:%s:%s' with strength %s", concept1, relation, concept2, strength)
         return {
             "concept1": concept1,
             "relation": relation,
@@ -253,8 +254,7 @@ class QkismModel:
         Returns:
             float: Relation strength or 0.0 if not found
         """
-        relation_key = f"{concept1}:{relation}:{concept2}"
-        return self.symbolic_relations.get(relation_key, 0.0)
+        return self.symbolic_relations.get((concept1, relation, concept2), 0.0)
     
     def get_related_concepts(self, concept, relation=None):
         """
@@ -269,13 +269,7 @@ class QkismModel:
         """
         related = []
         
-        for relation_key, strength in self.symbolic_relations.items():
-            parts = relation_key.split(':')
-            if len(parts) != 3:
-                continue
-            
-            c1, rel, c2 = parts
-            
+        for (c1, rel, c2), strength in self.symbolic_relations.items():
             if c1 == concept and (relation is None or rel == relation):
                 related.append({
                     "concept": c2,
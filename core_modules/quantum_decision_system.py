@@ -16,10 +16,175 @@ Implements quantum superposition and collapse for probabilistic token decision m
 """
 
 import numpy as np
+import bisect
+import functools
+import itertools
 import math
 from collections import OrderedDict
 import random
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Below this many outcomes a plain loop beats NumPy's per-call overhead
+_VECTOR_ENTROPY_MIN = 64
+
+# Shared empty 'entangled_with' of tokens never entangled, replaced by a
+# set of their own on the first entanglement
+_NO_ENTANGLEMENT = frozenset()
+
+
+class _TokenState(dict):
+    """
+    Superposition state of a token
+    
+    The outcome -> probability 'superposition' dict is no longer stored:
+    reading state['superposition'] (or .get) derives a fresh copy from the
+    parallel 'outcomes' and 'probs' entries, for callers of the old shape.
+    """
+    
+    def __missing__(self, key):
+        if key == 'superposition':
+            return dict(zip(self['outcomes'], self['probs'].tolist()))
+        raise KeyError(key)
+    
+    def get(self, key, default=None):
+        if key in self or key == 'superposition':
+            return self[key]
+        return default
+
+
+@functools.lru_cache(maxsize=64)
+def _interference_pattern(n):
+    """
+    Spin-up interference adjustment 0.2 * sin(i * pi / n) for each of n outcomes
+    
+    Only depends on the number of outcomes, which recurs, so memoized.
+    """
+    return tuple(0.2 * math.sin(i * math.pi / n) for i in range(n))
+
+
+def _collapse_kernel(probabilities, spin, u):
+    """
+    Index of the outcome observed when collapsing a superposition
+    
+    Applies the spin interference (spin times _interference_pattern, floored
+    at 0.001) to probabilities, then samples the adjusted distribution by
+    inverse CDF with the uniform draw u in [0, 1). Plain loop so Numba can
+    compile it.
+    """
+    n = probabilities.shape[0]
+    cumulative = np.empty(n)
+    total = 0.0
+    for i in range(n):
+        # Alternating adjustment simulates wave interference
+        p = probabilities[i] + 0.2 * spin * math.sin(i * math.pi / n)
+        total += max(0.001, p)
+        cumulative[i] = total
+    threshold = u * total
+    for i in range(n - 1):
+        if cumulative[i] > threshold:
+            return i
+    return n - 1
+
+
+def _collapse_inverse_cdf(probabilities, spin, u):
+    """
+    Pure Python equivalent of _collapse_kernel for when Numba is unavailable
+    
+    Cumulative sums plus a bisection, which beats NumPy's per-call overhead
+    on the handful of outcomes a token usually has.
+    """
+    n = len(probabilities)
+    cumulative = list(itertools.accumulate(
+        max(0.001, p + spin * adjustment)
+        for p, adjustment in zip(probabilities.tolist(), _interference_pattern(n))
+    ))
+    return bisect.bisect(cumulative, u * cumulative[-1], 0, n - 1)
+
+
+def _reweight_kernel(probabilities, index, strength):
+    """
+    Reweight and normalize probabilities in place, returning their Shannon entropy
+    
+    The outcome at index is scaled by (1 + strength) and every other one by
+    (1 - strength / 2), as entanglement does; strength 0 only normalizes.
+    Plain loop so Numba can compile it.
+    """
+    n = probabilities.shape[0]
+    total = 0.0
+    for i in range(n):
+        if i == index:
+            probabilities[i] *= 1 + strength
+        else:
+            probabilities[i] *= 1 - strength / 2
+        total += probabilities[i]
+    entropy = 0.0
+    for i in range(n):
+        p = probabilities[i] / total
+        probabilities[i] = p
+        if p > 0:  # Avoid log(0)
+            entropy -= p * math.log2(p)
+    return entropy
+
+
+def _reweight_numpy(probabilities, index, strength):
+    """Vectorized equivalent of _reweight_kernel for when Numba is unavailable"""
+    if strength:
+        observed = probabilities[index] * (1 + strength)
+        probabilities *= 1 - strength / 2
+        probabilities[index] = observed
+    probabilities /= probabilities.sum()
+    return _shannon_entropy(probabilities)
+
+
+if NUMBA_AVAILABLE:
+    _collapse_sample = njit(cache=True, boundscheck=False)(_collapse_kernel)
+    _reweight = njit(cache=True, boundscheck=False)(_reweight_kernel)
+else:
+    _collapse_sample = _collapse_inverse_cdf
+    _reweight = _reweight_numpy
+
+
+def _shannon_entropy(probabilities):
+    """Shannon entropy -sum(p_i * log2(p_i)) of a float64 array of probabilities"""
+    if probabilities.shape[0] >= _VECTOR_ENTROPY_MIN:
+        p = probabilities[probabilities > 0]  # Avoid log(0)
+        return float(-np.dot(p, np.log2(p)))
+    
+    entropy = 0
+    for p in probabilities.tolist():
+        if p > 0:  # Avoid log(0)
+            entropy -= p * math.log2(p)
+            
+    return entropy
+
+
+def _entanglement_key(token_id1, token_id2):
+    """
+    Order-independent entanglement_matrix key for a pair of tokens
+    
+    Same pair as tuple(sorted([token_id1, token_id2])) without building and
+    sorting a list; IDs that don't compare fall back to ordering by str.
+    """
+    try:
+        return (token_id2, token_id1) if token_id2 < token_id1 else (token_id1, token_id2)
+    except TypeError:
+        return tuple(sorted((token_id1, token_id2), key=str))
+
+
+def _quantum_decision_warmup():
+    """Compile (or load from cache) the kernels so the first superposition doesn't pay for it"""
+    _collapse_sample(np.full(2, 0.5), 1, 0.5)
+    _reweight(np.full(2, 0.5), 0, 0.5)
+
+
+_quantum_decision_warmup()
+
 class QuantumDecisionSystem:
     def __init__(self, architecture_config=None):
         """Initialize the Quantum Decision System"""
@@ -32,6 +197,15 @@ class QuantumDecisionSystem:
         self.superposition_states = {}
         self.entanglement_matrix = {}
         
+        # Running entanglement network totals for measure_entanglement_network
+        self._entangled_nodes = set()
+        self._entanglement_strength_sum = 0.0
+        
+        # Running state totals for get_system_metrics: number of collapsed
+        # states, and the current entropy of every state (0 once collapsed)
+        self._n_collapsed = 0
+        self._entropy_cache = {}
+        
     def create_superposition(self, token_id, probabilities):
         """
         Create a quantum superposition state for a token
@@ -41,23 +215,34 @@ class QuantumDecisionSystem:
             probabilities: Dictionary of {outcome: probability} pairs
             
         Returns:
-            Dictionary representing superposition state
+            Dictionary representing superposition state, with the outcomes
+            tuple and their normalized probabilities (float64 array) stored
+            as parallel 'outcomes' and 'probs' entries; 'superposition' is
+            still readable as a derived {outcome: probability} copy
         """
-        # Normalize probabilities
-        total = sum(probabilities.values())
-        normalized = {k: v/total for k, v in probabilities.items()}
+        # Outcomes and their normalized probabilities, as parallel arrays
+        outcomes = tuple(probabilities)
+        probs = np.fromiter(probabilities.values(), dtype=np.float64, count=len(outcomes))
+        entropy = _reweight(probs, -1, 0.0)
         
         # Create quantum state
-        state = {
-            'token_id': token_id,
-            'superposition': normalized,
-            'collapsed': False,
-            'observed_value': None,
-            'spin': self._initialize_spin(),
-            'entangled_with': set()
-        }
+        state = _TokenState(
+            token_id=token_id,
+            outcomes=outcomes,
+            probs=probs,
+            collapsed=False,
+            observed_value=None,
+            spin=self._initialize_spin(),
+            entangled_with=_NO_ENTANGLEMENT  # Set of entangled token IDs
+        )
+        
+        # A token created again replaces its previous state
+        previous = self.superposition_states.get(token_id)
+        if previous is not None and previous['collapsed']:
+            self._n_collapsed -= 1
         
         self.superposition_states[token_id] = state
+        self._entropy_cache[token_id] = entropy
         return state
     
     def _initialize_spin(self):
@@ -83,14 +268,25 @@ class QuantumDecisionSystem:
         if token_id1 not in self.superposition_states or token_id2 not in self.superposition_states:
             return False
             
-        # Add to entanglement sets
-        self.superposition_states[token_id1]['entangled_with'].add(token_id2)
-        self.superposition_states[token_id2]['entangled_with'].add(token_id1)
+        # Add to entanglement sets (created on a token's first entanglement)
+        for token_id, other_id in ((token_id1, token_id2), (token_id2, token_id1)):
+            state = self.superposition_states[token_id]
+            if state['entangled_with'] is _NO_ENTANGLEMENT:
+                state['entangled_with'] = set()
+            state['entangled_with'].add(other_id)
         
         # Record entanglement strength
-        entanglement_key = tuple(sorted([token_id1, token_id2]))
+        entanglement_key = _entanglement_key(token_id1, token_id2)
+        previous_strength = self.entanglement_matrix.get(entanglement_key)
         self.entanglement_matrix[entanglement_key] = strength
         
+        # Update network totals (re-entangling replaces the old strength)
+        if previous_strength is None:
+            self._entangled_nodes.update(entanglement_key)
+            self._entanglement_strength_sum += strength
+        else:
+            self._entanglement_strength_sum += strength - previous_strength
+        
         return True
     
     def collapse_state(self, token_id, uncertainty_level=None):
@@ -121,45 +317,24 @@ class QuantumDecisionSystem:
         if not should_collapse:
             return None
             
-        # Perform measurement/collapse
-        superposition = state['superposition']
-        outcomes = list(superposition.keys())
-        probabilities = list(superposition.values())
-        
-        # Apply quantum interference effects based on spin
-        probabilities = self._apply_quantum_interference(probabilities, state['spin'])
-        
-        # Normalize probabilities after interference
-        total = sum(probabilities)
-        probabilities = [p/total for p in probabilities]
-        
-        # Select outcome based on probability distribution
-        observed_value = np.random.choice(outcomes, p=probabilities)
+        # Perform measurement/collapse:
+        # apply quantum interference effects based on spin, then select
+        # outcome based on the adjusted probability distribution
+        index = _collapse_sample(state['probs'], state['spin'], random.random())
+        observed_value = state['outcomes'][index]
         
         # Update state
         state['collapsed'] = True
         state['observed_value'] = observed_value
+        self._n_collapsed += 1
+        self._entropy_cache[token_id] = 0  # No uncertainty in collapsed state
         
-        # Propagate collapse to entangled tokens
-        self._propagate_entanglement_collapse(token_id, observed_value)
+        # Propagate collapse to entangled tokens, if any
+        if state['entangled_with']:
+            self._propagate_entanglement_collapse(token_id, observed_value)
         
         return observed_value
     
-    def _apply_quantum_interference(self, probabilities, spin):
-        """Apply quantum interference effects to probabilities based on spin"""
-        # Simulating quantum interference by adjusting probabilities
-        interference_factor = 0.2 * spin  # +0.2 or -0.2 based on spin
-        
-        # Apply interference
-        adjusted = []
-        for i, p in enumerate(probabilities):
-            # Alternating adjustment simulates wave interference
-            adjustment = interference_factor * math.sin(i * math.pi / len(probabilities))
-            new_p = p + adjustment
-            adjusted.append(max(0.001, new_p))  # Ensure no negative probabilities
-            
-        return adjusted
-    
     def _propagate_entanglement_collapse(self, token_id, observed_value):
         """Propagate collapse effects to entangled tokens"""
         state = self.superposition_states[token_id]
@@ -173,7 +348,7 @@ class QuantumDecisionSystem:
                     continue
                     
                 # Get entanglement strength
-                entanglement_key = tuple(sorted([token_id, entangled_id]))
+                entanglement_key = _entanglement_key(token_id, entangled_id)
                 strength = self.entanglement_matrix.get(entanglement_key, 0.5)
                 
                 # Adjust probabilities based on entanglement
@@ -181,21 +356,14 @@ class QuantumDecisionSystem:
     
     def _adjust_entangled_probabilities(self, entangled_state, observed_value, strength):
         """Adjust probabilities of an entangled token based on observed value"""
-        superposition = entangled_state['superposition']
+        outcomes = entangled_state['outcomes']
         
         # Check if observed value exists in entangled token's possibilities
-        if observed_value in superposition:
-            # Increase probability of the same outcome
-            for outcome in superposition:
-                if outcome == observed_value:
-                    superposition[outcome] = superposition[outcome] * (1 + strength)
-                else:
-                    superposition[outcome] = superposition[outcome] * (1 - strength/2)
-                    
-            # Normalize
-            total = sum(superposition.values())
-            for outcome in superposition:
-                superposition[outcome] = superposition[outcome] / total
+        if observed_value in outcomes:
+            # Increase probability of the same outcome, decrease the others,
+            # then normalize
+            entropy = _reweight(entangled_state['probs'], outcomes.index(observed_value), strength)
+            self._entropy_cache[entangled_state['token_id']] = entropy
     
     def calculate_entropy(self, token_id):
         """Calculate Shannon entropy of a token's superposition state"""
@@ -207,27 +375,17 @@ class QuantumDecisionSystem:
             return 0  # No uncertainty in collapsed state
             
         # Calculate Shannon entropy: -sum(p_i * log2(p_i))
-        entropy = 0
-        for p in state['superposition'].values():
-            if p > 0:  # Avoid log(0)
-                entropy -= p * math.log2(p)
-                
-        return entropy
+        return _shannon_entropy(state['probs'])
     
     def measure_entanglement_network(self):
         """Measure properties of the entanglement network"""
         if not self.entanglement_matrix:
             return {"size": 0, "avg_strength": 0, "density": 0}
             
-        # Calculate network properties
-        nodes = set()
-        for k in self.entanglement_matrix:
-            nodes.add(k[0])
-            nodes.add(k[1])
-            
-        n_nodes = len(nodes)
+        # Calculate network properties from the totals kept by entangle_tokens
+        n_nodes = len(self._entangled_nodes)
         n_edges = len(self.entanglement_matrix)
-        avg_strength = sum(self.entanglement_matrix.values()) / n_edges if n_edges > 0 else 0
+        avg_strength = self._entanglement_strength_sum / n_edges if n_edges > 0 else 0
         max_edges = n_nodes * (n_nodes - 1) / 2 if n_nodes > 1 else 1
         density = n_edges / max_edges if max_edges > 0 else 0
         
@@ -242,17 +400,21 @@ class QuantumDecisionSystem:
         """Reset all quantum states"""
         self.superposition_states = {}
         self.entanglement_matrix = {}
+        self._entangled_nodes = set()
+        self._entanglement_strength_sum = 0.0
+        self._n_collapsed = 0
+        self._entropy_cache = {}
         
     def get_system_metrics(self):
         """Get metrics about the quantum decision system"""
-        # Count collapsed vs uncollapsed states
+        # Count collapsed vs uncollapsed states (kept up to date as states change)
         total_states = len(self.superposition_states)
-        collapsed_states = sum(1 for s in self.superposition_states.values() if s['collapsed'])
+        collapsed_states = self._n_collapsed
         
-        # Calculate average entropy
+        # Calculate average entropy from the per-state entropies
         avg_entropy = 0
         if total_states > 0:
-            avg_entropy = sum(self.calculate_entropy(tid) for tid in self.superposition_states) / total_states
+            avg_entropy = sum(self._entropy_cache.values()) / total_states
             
         # Get entanglement network metrics
         entanglement_metrics = self.measure_entanglement_network()
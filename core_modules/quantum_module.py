@@ -370,7 +370,7 @@ class QuantumTree:
         key = (id(node1), id(node2))
         self.entanglement_map[key] = strength
         
-        logger.debug(f"Created entanglement between nodes with strength {strength}")
+        logger.debug("Created entanglement between nodes with strength %s", strength)
         return (node1, node2)
     
     def collapse_tree(self):
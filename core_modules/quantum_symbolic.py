@@ -11,21 +11,29 @@ All outputs are subject to integrity validation and ethical compliance enforced
 
 import logging
 import math
-import random
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Below this many probabilities a plain loop beats NumPy's per-call overhead
+_VECTOR_ENTROPY_MIN = 64
+
 class SymbolicEncoder:
     """
     Encodes symbolic concepts into quantum-compatible vector representations.
     Part of the Qkism (Quantum-Kernel Integrated Symbolic Machine) system.
     """
-    def __init__(self, vector_size=64):
+    def __init__(self, vector_size=64, concept_cache_size=4096, dtype=np.complex128):
         self.vector_size = vector_size
-        self.concept_cache = {}
+        # Complex dtype of encoded vectors; np.complex64 halves their memory
+        # and the bytes moved by similarity products, at float32 precision
+        self.dtype = np.dtype(dtype)
+        # Encoded concepts (LRU, bounded for long-running processes)
+        self.concept_cache = OrderedDict()
+        self.concept_cache_size = concept_cache_size
         self.embedding_decay = 0.98
         logger.info(f"Symbolic Encoder initialized with vector_size={vector_size}")
     
@@ -37,42 +45,37 @@ class SymbolicEncoder:
             concept (str): Concept to encode
             
         Returns:
-            list: Vector representation of the concept
+            np.ndarray: Vector representation of the concept (of self.dtype)
         """
         if not concept:
             # Return zero vector for empty concepts
-            return [0.0] * self.vector_size
+            return np.zeros(self.vector_size, dtype=self.dtype)
         
         # Check if concept is already in cache
         if concept in self.concept_cache:
+            self.concept_cache.move_to_end(concept)
             return self.concept_cache[concept]
         
         # Deterministic encoding using hash for consistency
         # This creates a unique but reproducible encoding for each concept
-        concept_hash = hash(concept)
-        random.seed(concept_hash)
-        
-        # Generate vector components with complex phase elements
-        vector = []
-        for i in range(self.vector_size):
-            # Create components with magnitude and phase
-            magnitude = random.random()
-            phase = 2 * math.pi * random.random()
-            
-            # Convert to cartesian coordinates (real, imaginary)
-            real = magnitude * math.cos(phase)
-            imag = magnitude * math.sin(phase)
-            
-            # Store as complex number representation
-            vector.append(complex(real, imag))
+        # (a local generator seeded with the full 64-bit hash, so the global
+        # random module is left alone)
+        rng = np.random.default_rng(hash(concept) & 0xFFFFFFFFFFFFFFFF)
+        
+        # Generate vector components with magnitude and phase, in one draw
+        draws = rng.random(2 * self.vector_size)
+        magnitude = draws[:self.vector_size]
+        phase = 2 * np.pi * draws[self.vector_size:]
         
-        # Normalize the vector
-        vector = self._normalize_vector(vector)
+        # Complex components (magnitude * e^(i*phase)), normalized
+        vector = self._normalize_vector(magnitude * np.exp(1j * phase))
         
         # Cache the result
         self.concept_cache[concept] = vector
+        if len(self.concept_cache) > self.concept_cache_size:
+            self.concept_cache.popitem(last=False)
         
-        logger.debug(f"Encoded concept '{concept}' to {self.vector_size}-dimensional vector")
+        logger.debug("Encoded concept '%s' to %s-dimensional vector", concept, self.vector_size)
         return vector
     
     def _normalize_vector(self, vector):
@@ -80,48 +83,48 @@ class SymbolicEncoder:
         Normalize a complex vector.
         
         Args:
-            vector (list): Vector to normalize
+            vector (np.ndarray): Vector to normalize
             
         Returns:
-            list: Normalized vector
+            np.ndarray: Normalized vector
         """
-        # Calculate squared magnitude
-        squared_sum = sum(abs(c)**2 for c in vector)
+        vector = np.asarray(vector, dtype=self.dtype)
+        
+        # Euclidean norm from the complex self inner product (one BLAS call;
+        # cheaper than np.linalg.norm on short vectors)
+        norm = math.sqrt(np.vdot(vector, vector).real)
         
         # Avoid division by zero
-        if squared_sum == 0:
+        if norm == 0:
             return vector
         
-        # Normalize
-        norm = math.sqrt(squared_sum)
-        normalized = [c / norm for c in vector]
-        
-        return normalized
+        return vector / norm
     
     def calculate_similarity(self, vector1, vector2):
         """
         Calculate similarity between two concept vectors.
         
         Args:
-            vector1 (list): First concept vector
-            vector2 (list): Second concept vector
+            vector1 (array-like): First concept vector
+            vector2 (array-like): Second concept vector
             
         Returns:
             float: Similarity score (-1.0 to 1.0)
         """
-        if not vector1 or not vector2:
+        if len(vector1) == 0 or len(vector2) == 0:
             return 0.0
         
-        # Ensure equal length
-        min_length = min(len(vector1), len(vector2))
-        v1 = vector1[:min_length]
-        v2 = vector2[:min_length]
+        # Ensure equal length (encoder vectors already share vector_size)
+        if len(vector1) != len(vector2):
+            min_length = min(len(vector1), len(vector2))
+            vector1 = vector1[:min_length]
+            vector2 = vector2[:min_length]
         
-        # Calculate complex inner product
-        inner_product = sum(v1[i].conjugate() * v2[i] for i in range(min_length))
+        # Complex inner product (conjugating the first vector)
+        inner_product = np.vdot(vector1, vector2)
         
-        # Return real part of the inner product as similarity
-        return abs(inner_product)
+        # Return magnitude of the inner product as similarity
+        return float(abs(inner_product))
     
     def blend_concepts(self, concept1, concept2, weight1=0.5):
         """
@@ -133,7 +136,7 @@ class SymbolicEncoder:
             weight1 (float): Weight of first concept (0.0-1.0)
             
         Returns:
-            list: Blended vector
+            np.ndarray: Blended vector
         """
         # Encode concepts
         vector1 = self.encode_concept(concept1)
@@ -143,9 +146,8 @@ class SymbolicEncoder:
         weight2 = 1.0 - weight1
         
         # Blend vectors
-        blended = []
-        for i in range(min(len(vector1), len(vector2))):
-            blended.append(vector1[i] * weight1 + vector2[i] * weight2)
+        n = min(len(vector1), len(vector2))
+        blended = vector1[:n] * weight1 + vector2[:n] * weight2
         
         # Normalize the result
         return self._normalize_vector(blended)
@@ -158,6 +160,13 @@ class QuantumSymbolicProcessor:
     def __init__(self, encoder=None):
         self.encoder = encoder or SymbolicEncoder()
         self.concept_relations = {}
+        # Encoded relation concepts: relation -> (concept1, concept2,
+        # vector1, vector2, phase1, phase2), filled by add_relation
+        self._relation_encodings = {}
+        # The same encodings stacked one row per relation for
+        # _quantum_reasoning, rebuilt when concept_relations changes
+        self._relation_snapshot = ()
+        self._relation_matrices = None
         self.probability_threshold = 0.7
         logger.info("Quantum Symbolic Processor initialized")
     
@@ -200,23 +209,20 @@ class QuantumSymbolicProcessor:
         Create a quantum superposition from vectors.
         
         Args:
-            primary_vector (list): Primary vector
-            secondary_vector (list): Optional secondary vector
+            primary_vector (np.ndarray): Primary vector
+            secondary_vector (np.ndarray): Optional secondary vector
             
         Returns:
-            list: Superposition state
+            np.ndarray: Superposition state
         """
         # If no secondary vector, return primary
         if secondary_vector is None:
             return primary_vector
         
-        # Create superposition with phase relationship
-        superposition = []
-        for i in range(min(len(primary_vector), len(secondary_vector))):
-            # Weighted combination with phase interference
-            superposition.append(
-                primary_vector[i] * 0.7 + secondary_vector[i] * 0.3
-            )
+        # Create superposition with phase relationship:
+        # weighted combination with phase interference
+        n = min(len(primary_vector), len(secondary_vector))
+        superposition = primary_vector[:n] * 0.7 + secondary_vector[:n] * 0.3
         
         # Normalize
         return self.encoder._normalize_vector(superposition)
@@ -226,39 +232,65 @@ class QuantumSymbolicProcessor:
         Apply quantum reasoning to a state vector.
         
         Args:
-            state_vector (list): Quantum state vector
+            state_vector (np.ndarray): Quantum state vector
             
         Returns:
             dict: Reasoning results
         """
-        # Initialize results
-        results = {}
+        if not self.concept_relations:
+            return {}
+        
+        relations, vectors1, vectors2, phase_diffs = self._get_relation_matrices()
         
-        # Apply quantum operators to the state
+        # Bring the state to the encoder's vector size (zero padding keeps
+        # its inner products unchanged)
+        state = np.asarray(state_vector, dtype=vectors1.dtype)[:vectors1.shape[1]]
+        if state.shape[0] < vectors1.shape[1]:
+            state = np.pad(state, (0, vectors1.shape[1] - state.shape[0]))
+        state = state.conj()
+        
+        # Apply quantum operators to the state, for all relations at once
         # This is a simplified version of quantum reasoning
-        for relation, (concept1, concept2) in self.concept_relations.items():
-            # Encode related concepts
-            concept1_vector = self.encoder.encode_concept(concept1)
-            concept2_vector = self.encoder.encode_concept(concept2)
-            
-            # Calculate similarities
-            similarity1 = self.encoder.calculate_similarity(state_vector, concept1_vector)
-            similarity2 = self.encoder.calculate_similarity(state_vector, concept2_vector)
-            
-            # Calculate combined relevance with quantum interference
-            phase1 = math.atan2(concept1_vector[0].imag, concept1_vector[0].real)
-            phase2 = math.atan2(concept2_vector[0].imag, concept2_vector[0].real)
-            
-            # Interference term
-            interference = 2 * math.sqrt(similarity1 * similarity2) * math.cos(phase1 - phase2)
-            
-            # Calculate probability considering interference
-            probability = (similarity1 + similarity2 + interference) / 3
-            
-            # Store result
-            results[relation] = probability
+        similarities1 = np.abs(vectors1 @ state)
+        similarities2 = np.abs(vectors2 @ state)
+        
+        # Interference term from the phases of the related concepts
+        interference = 2 * np.sqrt(similarities1 * similarities2) * np.cos(phase_diffs)
+        
+        # Calculate probability considering interference
+        probabilities = (similarities1 + similarities2 + interference) / 3
+        
+        return dict(zip(relations, probabilities.tolist()))
+    
+    def _get_relation_matrices(self):
+        """
+        Relation encodings stacked for _quantum_reasoning.
+        
+        Rebuilt only when concept_relations differs from the last build,
+        which also catches relations edited without add_relation.
         
-        return results
+        Returns:
+            tuple: (relations, vectors1, vectors2, phase_diffs), with one
+                row/entry per relation in concept_relations order
+        """
+        snapshot = tuple(self.concept_relations.items())
+        if self._relation_matrices is None or snapshot != self._relation_snapshot:
+            encodings = []
+            for relation, (concept1, concept2) in snapshot:
+                encoding = self._relation_encodings.get(relation)
+                if encoding is None or encoding[:2] != (concept1, concept2):
+                    encoding = self._encode_relation(relation, concept1, concept2)
+                encodings.append(encoding)
+            
+            _, _, vectors1, vectors2, phases1, phases2 = zip(*encodings)
+            self._relation_matrices = (
+                tuple(self.concept_relations),
+                np.stack(vectors1),
+                np.stack(vectors2),
+                np.subtract(phases1, phases2)
+            )
+            self._relation_snapshot = snapshot
+        return self._relation_matrices
     
     def _extract_top_concepts(self, probability_distribution, top_n=3):
         """
@@ -309,7 +341,12 @@ class QuantumSymbolicProcessor:
         probabilities = list(probability_distribution.values())
         
         # Calculate entropy
-        entropy = -sum(p * math.log(p) if p > 0 else 0 for p in probabilities)
+        if len(probabilities) >= _VECTOR_ENTROPY_MIN:
+            p = np.array(probabilities)
+            p = p[p > 0]
+            entropy = float(-np.dot(p, np.log(p)))
+        else:
+            entropy = -sum(p * math.log(p) if p > 0 else 0 for p in probabilities)
         
         # Normalize entropy
         max_entropy = math.log(len(probabilities)) if probabilities else 1.0
@@ -333,8 +370,35 @@ class QuantumSymbolicProcessor:
             bool: Success status
         """
         self.concept_relations[relation] = (concept1, concept2)
-        logger.debug(f"Added relation: {concept1} {relation} {concept2}")
+        self._encode_relation(relation, concept1, concept2)
+        logger.debug("Added relation: %s %s %s", concept1, relation, concept2)
         return True
+    
+    def _encode_relation(self, relation, concept1, concept2):
+        """
+        Encode the concepts of a relation once, with the phases of their
+        first components used for interference in _quantum_reasoning.
+        
+        Args:
+            relation (str): Relation type
+            concept1 (str): First concept
+            concept2 (str): Second concept
+            
+        Returns:
+            tuple: (concept1, concept2, vector1, vector2, phase1, phase2)
+        """
+        vector1 = self.encoder.encode_concept(concept1)
+        vector2 = self.encoder.encode_concept(concept2)
+        encoding = (
+            concept1,
+            concept2,
+            vector1,
+            vector2,
+            math.atan2(vector1[0].imag, vector1[0].real),
+            math.atan2(vector2[0].imag, vector2[0].real)
+        )
+        self._relation_encodings[relation] = encoding
+        return encoding
 
 class SymbolicAlignment:
     """
@@ -361,36 +425,29 @@ class SymbolicAlignment:
         if not symbols or not quantum_states:
             return {"aligned_pairs": [], "alignment_score": 0.0}
         
-        # Encode symbols
-        symbol_vectors = [self.encoder.encode_concept(s) for s in symbols]
-        
-        # Calculate alignment scores
-        alignment_scores = []
-        for i, symbol_vector in enumerate(symbol_vectors):
-            for j, quantum_state in enumerate(quantum_states):
-                # Convert quantum state to comparable format if needed
-                if isinstance(quantum_state, tuple) and len(quantum_state) == 2:
-                    # Convert (real, imaginary) to complex number
-                    qstate = complex(quantum_state[0], quantum_state[1])
-                    quantum_vector = [qstate] * len(symbol_vector)
-                else:
-                    quantum_vector = quantum_state
-                
-                # Calculate similarity
-                similarity = self.encoder.calculate_similarity(symbol_vector, quantum_vector)
-                
-                alignment_scores.append((i, j, similarity))
-        
-        # Sort by similarity
-        alignment_scores.sort(key=lambda x: x[2], reverse=True)
+        # Encode symbols, one row per symbol
+        symbol_matrix = np.stack([self.encoder.encode_concept(s) for s in symbols])
+        state_matrix = self._state_matrix(quantum_states, symbol_matrix.shape[1])
+        
+        # Calculate all alignment scores at once: |<symbol_i|state_j>|
+        scores = np.abs(symbol_matrix.conj() @ state_matrix.T)
+        
+        # Visit (symbol, state) pairs by decreasing similarity; the stable
+        # sort keeps ties in symbol-then-state order
+        order = np.argsort(-scores, axis=None, kind='stable')
+        flat_scores = scores.ravel()[order]
         
         # Extract aligned pairs above threshold
         aligned_pairs = []
         used_symbols = set()
         used_states = set()
+        num_states = state_matrix.shape[0]
         
-        for sym_idx, state_idx, score in alignment_scores:
-            if score >= self.alignment_threshold and sym_idx not in used_symbols and state_idx not in used_states:
+        for flat_idx, score in zip(order.tolist(), flat_scores.tolist()):
+            if score < self.alignment_threshold:
+                break
+            sym_idx, state_idx = divmod(flat_idx, num_states)
+            if sym_idx not in used_symbols and state_idx not in used_states:
                 aligned_pairs.append({
                     "symbol": symbols[sym_idx],
                     "state_index": state_idx,
@@ -407,6 +464,31 @@ class SymbolicAlignment:
             "alignment_score": overall_score
         }
     
+    def _state_matrix(self, quantum_states, size):
+        """
+        Stack quantum states into a (len(quantum_states), size) complex matrix.
+        
+        A (real, imaginary) tuple stands for that amplitude on every component.
+        Other states are truncated or zero-padded to size, which leaves their
+        inner product with a symbol vector unchanged.
+        
+        Args:
+            quantum_states (list): Quantum states
+            size (int): Vector size of the symbol vectors
+            
+        Returns:
+            np.ndarray: State matrix
+        """
+        state_matrix = np.zeros((len(quantum_states), size), dtype=self.encoder.dtype)
+        for j, quantum_state in enumerate(quantum_states):
+            if isinstance(quantum_state, tuple) and len(quantum_state) == 2:
+                # Convert (real, imaginary) to complex number
+                state_matrix[j] = complex(quantum_state[0], quantum_state[1])
+            else:
+                quantum_vector = np.asarray(quantum_state, dtype=self.encoder.dtype)[:size]
+                state_matrix[j, :len(quantum_vector)] = quantum_vector
+        return state_matrix
+    
     def calculate_interference(self, symbol1, symbol2):
         """
         Calculate quantum interference between symbols.
@@ -461,20 +543,56 @@ class SymbolicAlignment:
         if not symbols:
             return []
         
+        # Encode every symbol once, with the phase of its first component
+        vectors = np.stack([self.encoder.encode_concept(s) for s in symbols])
+        phases = np.angle(vectors[:, 0])
+        
+        # totals[j]: summed interference (see calculate_interference) of
+        # symbols[j] with the coherent set so far
+        totals = np.zeros(len(symbols))
+        
         # Initialize with first symbol
         coherent_set = [symbols[0]]
+        self._add_interference(totals, symbols, vectors, phases, 0)
         
         # Try adding each symbol
-        for symbol in symbols[1:]:
+        for i in range(1, len(symbols)):
             # Calculate average interference with current set
-            interferences = [
-                self.calculate_interference(symbol, s)
-                for s in coherent_set
-            ]
-            avg_interference = sum(interferences) / len(interferences)
+            avg_interference = totals[i] / len(coherent_set)
             
             # Add if coherent enough
             if avg_interference >= min_coherence:
-                coherent_set.append(symbol)
+                coherent_set.append(symbols[i])
+                self._add_interference(totals, symbols, vectors, phases, i)
         
         return coherent_set
+    
+    def _add_interference(self, totals, symbols, vectors, phases, index):
+        """
+        Add the interference of symbols[index] with every later symbol to totals.
+        
+        Like calculate_interference, pairs already in interference_matrix use
+        the cached value and new pairs are added to it.
+        
+        Args:
+            totals (np.ndarray): Running interference sums, updated in place
+            symbols (list): Symbols, in the order of the vector rows
+            vectors (np.ndarray): Symbol vectors, one per row
+            phases (np.ndarray): Phase of each vector's first component
+            index (int): Row of the symbol joining the coherent set
+        """
+        rest = slice(index + 1, None)
+        similarity = np.abs(vectors[rest] @ vectors[index].conj())
+        interference = similarity * np.cos(phases[rest] - phases[index])
+        
+        member = symbols[index]
+        cache = self.interference_matrix
+        for offset, (symbol, value) in enumerate(zip(symbols[rest], interference.tolist())):
+            cached = cache.get((symbol, member))
+            if cached is None:
+                cached = cache.get((member, symbol))
+            if cached is None:
+                cache[(symbol, member)] = value
+            else:
+                interference[offset] = cached
+        totals[rest] += interference
@@ -41,9 +41,26 @@ class QueryProcessor:
                 r'facts', r'history of', r'data on'
             ]
         }
+        
+        # Compiled patterns, so classification skips re's per-call pattern
+        # cache lookup (rebuilt by _update_compiled_patterns when self.patterns changes)
+        self._patterns_snapshot = None
+        self._update_compiled_patterns()
         self.initialized = True
         logger.info("Query Processor initialized")
     
+    def _update_compiled_patterns(self):
+        """Recompile the classification patterns if self.patterns changed since the last compile"""
+        if self.patterns == self._patterns_snapshot:
+            return
+        self._compiled_patterns = {
+            query_type: tuple(re.compile(pattern) for pattern in patterns)
+            for query_type, patterns in self.patterns.items()
+        }
+        self._patterns_snapshot = {
+            query_type: list(patterns) for query_type, patterns in self.patterns.items()
+        }
+    
     def classify_query(self, query):
         """
         Classify the query type based on content and patterns.
@@ -68,10 +85,13 @@ class QueryProcessor:
         }
         
         # Check for pattern matches
-        for query_type, patterns in self.patterns.items():
+        self._update_compiled_patterns()
+        for query_type, patterns in self._compiled_patterns.items():
+            count = 0
             for pattern in patterns:
-                if re.search(pattern, query_lower):
-                    matches[query_type] += 1
+                if pattern.search(query_lower):
+                    count += 1
+            matches[query_type] = count
         
         # Get query type with highest number of matches
         if max(matches.values()) == 0:
@@ -85,7 +105,7 @@ class QueryProcessor:
         total_matches = sum(matches.values())
         confidence = matches[query_type] / max(1, total_matches)
         
-        logger.debug(f"Classified query as {query_type} with confidence {confidence:.2f}")
+        logger.debug("Classified query as %s with confidence %.2f", query_type, confidence)
         return query_type, round(confidence, 2)
     
     def _classify_by_heuristics(self, query):
@@ -265,7 +285,7 @@ class BiasAttenuation:
             weights=[adjusted_distribution[p] for p in self.perspective_types]
         )[0]
         
-        logger.debug(f"Selected {perspective} perspective for response")
+        logger.debug("Selected %s perspective for response", perspective)
         return perspective
     
     def generate_multi_perspective_response(self, query, base_response):
@@ -13,6 +13,8 @@ import logging
 import json
 import time
 import math
+import heapq
+import itertools
 from datetime import datetime, timedelta
 import random
 import numpy as np
@@ -23,6 +25,11 @@ import os
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Per-process sequence appended to generated memory keys (after the pid, since
+# several worker processes share the databases), so memories created within
+# the same second get distinct keys
+_KEY_COUNTER = itertools.count()
+
 def determine_importance(content, context_type=None):
     """
     Determine the importance of content for memory retention.
@@ -99,7 +106,7 @@ def compress_content(content, compression_ratio=0.7):
     if not compressed.endswith('.'):
         compressed += '.'
 
-    logger.debug(f"Compressed content from {len(content)} to {len(compressed)} chars")
+    logger.debug("Compressed content from %s to %s chars", len(content), len(compressed))
     return compressed
 
 def semantic_search(query, hemisphere=None, tier=None, limit=5):
@@ -136,24 +143,23 @@ def semantic_search(query, hemisphere=None, tier=None, limit=5):
     candidate_memories = db_query.limit(limit * 5).all()
 
     # Simple relevance scoring - in a real system, this would use embeddings
+    query_words = set(query.lower().split())
+    query_size = max(1, len(query_words))
+
     scored_memories = []
     for memory in candidate_memories:
         # Basic relevance: count word overlaps
-        query_words = set(query.lower().split())
-        memory_words = set(memory.value.lower().split())
-        overlap = len(query_words.intersection(memory_words))
-        relevance = overlap / max(1, len(query_words))
+        overlap = len(query_words.intersection(memory.value.lower().split()))
+        relevance = overlap / query_size
 
         # Apply importance multiplier
         final_score = relevance * memory.importance
 
         scored_memories.append((memory, final_score))
 
-    # Sort by relevance score
-    scored_memories.sort(key=lambda x: x[1], reverse=True)
-
-    # Return the top memories
-    return [item[0] for item in scored_memories[:limit]]
+    # Return the top memories by relevance score
+    top_memories = heapq.nlargest(limit, scored_memories, key=lambda x: x[1])
+    return [item[0] for item in top_memories]
 
 class FibonacciMemoryOptimizer:
     """
@@ -273,7 +279,7 @@ class FibonacciMemoryOptimizer:
                 consolidated_memory = CognitiveMemory(
                     hemisphere=group[0].hemisphere,
                     tier=group[0].tier,
-                    key=f"consolidated_{int(time.time())}",
+                    key=f"consolidated_{int(time.time())}_{os.getpid()}_{next(_KEY_COUNTER)}",
                     value=compressed,
                     importance=max_importance,
                     expiration=latest_expiration
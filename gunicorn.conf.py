@@ -0,0 +1,27 @@
+"""
+This work is licensed under CC BY-NC 4.0 International.
+Commercial use requires prior written consent and compensation.
+Contact: sebastienbrulotte@gmail.com
+Attribution: Sebastien Brulotte aka [ Doditz ]
+
+This document is part of the NEURONAS cognitive system.
+Core modules referenced: BRONAS (Ethical Reflex Filter) and QRONAS (Probabilistic Symbolic Vector Engine).
+All outputs are subject to integrity validation and ethical compliance enforced by BRONAS.
+"""
+
+# Gunicorn configuration for Neuronas, picked up automatically by
+# `gunicorn main:app` when started from the project root.
+#
+# The cognitive state (app.gateway / CognitiveEngine mode, the gateway
+# response cache) and the tiered memory maintenance thread working on the
+# SQLite databases live inside the application process. Several worker
+# processes would each hold their own state (a `modulate stim` request would
+# only reach one of them) and run competing maintenance threads, so a single
+# worker is used and concurrency comes from its threads. Only raise
+# NEURONAS_WORKERS once that state has moved out of the process.
+import os
+
+bind = os.environ.get("NEURONAS_BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("NEURONAS_WORKERS", 1))
+worker_class = "gthread"
+threads = int(os.environ.get("NEURONAS_THREADS", 8))
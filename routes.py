@@ -280,8 +280,7 @@ def register_routes(app):
         # Calculate processing time
         processing_time = time.time() - start_time
 
-        # Log the query
-        from models import QueryLog, db
+        # Log the query (QueryLog and db are imported at module level)
         query_log = QueryLog(
             query=query,
             response=response['response'],
@@ -0,0 +1,222 @@
+"""
+This work is licensed under CC BY-NC 4.0 International.
+Commercial use requires prior written consent and compensation.
+Contact: sebastienbrulotte@gmail.com
+Attribution: Sebastien Brulotte aka [ Doditz ]
+
+This document is part of the NEURONAS cognitive system.
+Core modules referenced: BRONAS (Ethical Reflex Filter) and QRONAS (Probabilistic Symbolic Vector Engine).
+All outputs are subject to integrity validation and ethical compliance enforced by BRONAS.
+"""
+
+"""
+Behavior tests for the core_modules cognitive components
+
+Pins down observable behavior (state shapes, scoring, defaults) that the
+modules' internal optimizations must preserve.
+"""
+
+import numpy as np
+
+
+def test_superposition_state_shape():
+    """Superposition states hold parallel outcomes/probs, with a derived 'superposition' view"""
+    from core_modules.quantum_decision_system import QuantumDecisionSystem
+    
+    system = QuantumDecisionSystem()
+    state = system.create_superposition("token", {"a": 2.0, "b": 1.0, "c": 1.0})
+    
+    assert state['outcomes'] == ("a", "b", "c")
+    assert isinstance(state['probs'], np.ndarray)
+    assert state['probs'].dtype == np.float64
+    np.testing.assert_allclose(state['probs'], [0.5, 0.25, 0.25])
+    assert state['collapsed'] is False
+    assert state['observed_value'] is None
+    assert state['spin'] in (1, -1)
+    assert not state['entangled_with']
+    
+    # The old outcome -> probability dict is still readable, as a copy
+    assert state['superposition'] == {"a": 0.5, "b": 0.25, "c": 0.25}
+    assert state.get('superposition') == state['superposition']
+    state['superposition']["a"] = 0.0
+    assert state['probs'][0] == 0.5
+    assert state.get('missing', 'default') == 'default'
+
+
+def test_bronas_risk_counts_keyword_occurrences():
+    """BRONAS risk counts every keyword occurrence, capped at 5 per category"""
+    import pytest
+    from core_modules.ethical_framework import BronasEthicalFramework
+    
+    bronas = BronasEthicalFramework()
+    
+    assert bronas._assess_ethical_risk("A calm sentence.").score == 0.0
+    assert bronas._assess_ethical_risk("This could harm someone.").score == pytest.approx(0.2)
+    assert bronas._assess_ethical_risk("Harm upon HARM.").score == pytest.approx(0.4)
+    assert bronas._assess_ethical_risk("It is always, always true.").score == pytest.approx(0.2)
+    assert bronas._assess_ethical_risk("It will definitely hurt.").score == pytest.approx(0.3)
+    
+    # Each category is clamped at 5 hits before weighting
+    assert bronas._assess_ethical_risk("never " * 8).score == pytest.approx(0.5)
+    assert bronas._assess_ethical_risk("hate " * 8).score == pytest.approx(1.0)
+    
+    report = bronas._assess_ethical_risk("Definitely illegal.")
+    assert report.harmful_hit and report.certain_hit
+
+
+def test_bronas_repeated_harmful_word_reaches_strict_filtering():
+    """Four occurrences of one harmful word cross the high threshold and are removed"""
+    from core_modules.ethical_framework import BronasEthicalFramework
+    
+    bronas = BronasEthicalFramework()
+    filtered = bronas.filter_content("harm, harm, harm and harm")
+    
+    assert "harm" not in filtered
+    assert filtered.count("[removed]") == 4
+    
+    # A single occurrence stays below the medium threshold and is kept
+    assert bronas.filter_content("Do no harm").startswith("Do no harm")
+
+
+def test_pathway_cross_talk_is_opt_in():
+    """select_pathway zeroes secondary pathways unless cross-talk is requested"""
+    import pytest
+    from core_modules.neural_pathway_router import NeuralPathwayRouter
+    
+    router = NeuralPathwayRouter()
+    classification = {"classification": "analytical", "confidence": 0.8}
+    
+    # Random cross-talk first, so the default call must clear it
+    selected = router.select_pathway(classification, 0.5, with_cross_talk=True)
+    primary = selected["selected_pathway"]
+    level = selected["activation_level"]
+    assert level == pytest.approx(0.8 * 0.85)
+    for pathway, info in router.pathways.items():
+        if pathway != primary:
+            assert 0.05 * level <= info["current_activation"] <= 0.2 * level
+    
+    selected = router.select_pathway(classification, 0.5)
+    assert selected["selected_pathway"] == primary
+    assert selected["activation_level"] == level
+    for pathway, info in selected["pathway_status"].items():
+        expected = level if pathway == primary else 0.0
+        assert info["current_activation"] == expected
+
+
+def test_d2stib_tokenizer_splits_one_trailing_punctuation_mark():
+    """Words split on whitespace, one trailing punctuation mark becomes its own token"""
+    from core_modules.d2stib_acceleration import D2STIBAccelerator
+    
+    accelerator = D2STIBAccelerator()
+    
+    assert accelerator._tokenize("Hello, world.") == ["Hello", ",", "world", "."]
+    assert accelerator._tokenize("don't stop-now!") == ["don't", "stop-now", "!"]
+    assert accelerator._tokenize("wait..") == ["wait.", "."]
+    # A lone punctuation word is one token, with no empty token before it
+    assert accelerator._tokenize("yes . no") == ["yes", ".", "no"]
+    assert accelerator._tokenize("   ") == []
+    
+    processed, efficiency = accelerator.process_text("Quantum memory, adapts!")
+    assert processed == "Quantum memory, adapts!"
+    assert efficiency["tokens_total"] == 5
+
+
+def test_concept_encoding_seeded_from_full_hash():
+    """Concept encodings come from a local generator seeded with all 64 bits of hash()"""
+    import random
+    from core_modules.quantum_symbolic import SymbolicEncoder
+    
+    class HashedConcept(str):
+        """Concept with a chosen hash, to control the encoding seed"""
+        def __new__(cls, text, hash_value):
+            concept = super().__new__(cls, text)
+            concept.hash_value = hash_value
+            return concept
+        
+        def __hash__(self):
+            return self.hash_value
+    
+    encoder = SymbolicEncoder(vector_size=16)
+    
+    # Magnitudes then phases, from one draw of the seeded generator
+    draws = np.random.default_rng(12345).random(32)
+    expected = draws[:16] * np.exp(2j * np.pi * draws[16:])
+    expected /= np.linalg.norm(expected)
+    vector = encoder.encode_concept(HashedConcept("seeded", 12345))
+    assert vector.dtype == np.complex128
+    np.testing.assert_allclose(vector, expected, rtol=0, atol=1e-12)
+    
+    # Hashes equal in their low 32 bits still give different encodings
+    low = encoder.encode_concept(HashedConcept("low", 7))
+    high = encoder.encode_concept(HashedConcept("high", 7 + (1 << 32)))
+    assert not np.allclose(low, high)
+    
+    # Reproducible across encoders, unit norm, global random state untouched
+    state = random.getstate()
+    first = SymbolicEncoder(vector_size=16).encode_concept("memory")
+    second = SymbolicEncoder(vector_size=16).encode_concept("memory")
+    assert random.getstate() == state
+    np.testing.assert_array_equal(first, second)
+    assert abs(np.linalg.norm(first) - 1.0) < 1e-12
+
+
+def test_modulation_values_are_raw_unless_rounding_requested():
+    """Modulation returns raw state floats; round_values=True gives the 2-decimal display dict"""
+    import pytest
+    from core_modules.modulation_engine import ModulationEngine
+    
+    engine = ModulationEngine()
+    state = engine.modulate_d2("stim", 0.123)
+    assert state["mode"] == "stim" and state["intensity"] == 0.123
+    assert state["d2_activation"] == pytest.approx(0.623)
+    assert state["d2_activation"] == engine.d2_activation
+    assert state["working_memory"] == pytest.approx(0.5 - 0.123 * 0.2)
+    
+    rounded = ModulationEngine().modulate_d2("stim", 0.123, round_values=True)
+    assert rounded == {
+        "d2_activation": 0.62,
+        "attention": round(state["attention"], 2),
+        "working_memory": 0.48,
+        "mode": "stim",
+        "intensity": 0.123
+    }
+
+
+def test_d2stib_token_importance_is_deterministic():
+    """Pattern-matched token importance comes from a stable digest, identical across instances"""
+    import hashlib
+    import pytest
+    from core_modules.d2stib_acceleration import D2STIBAccelerator
+    
+    def jitter(token):
+        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=2).digest()
+        return int.from_bytes(digest, "little") / 65535.0
+    
+    tokens = ["Quantum", "through", "the", "banana"]
+    first = D2STIBAccelerator()._calculate_token_importance(tokens)
+    second = D2STIBAccelerator()._calculate_token_importance(tokens)
+    np.testing.assert_array_equal(first, second)
+    
+    assert first[0] == pytest.approx(0.8 + jitter("quantum") * 0.2)
+    assert first[1] == pytest.approx(0.5 + jitter("through") * 0.3)
+    assert first[2] == pytest.approx(0.1 + jitter("the") * 0.4)
+    assert first[3] == pytest.approx(0.3 + 6 / 20)
+
+
+def test_coherent_subset_uses_interference_matrix():
+    """get_coherent_subset reads cached pair interferences and caches the pairs it scores"""
+    import pytest
+    from core_modules.quantum_symbolic import SymbolicAlignment
+    
+    alignment = SymbolicAlignment()
+    alignment.interference_matrix[("beta", "alpha")] = -1.0
+    alignment.interference_matrix[("alpha", "gamma")] = 1.0
+    
+    # Seeded values win in either key order
+    assert alignment.get_coherent_subset(["alpha", "beta", "gamma"], 0.5) == ["alpha", "gamma"]
+    
+    fresh = SymbolicAlignment()
+    fresh.get_coherent_subset(["alpha", "beta", "gamma"], -1.0)
+    for key in (("beta", "alpha"), ("gamma", "alpha"), ("gamma", "beta")):
+        cached = fresh.interference_matrix[key]
+        assert cached == pytest.approx(SymbolicAlignment().calculate_interference(*key), abs=1e-12)